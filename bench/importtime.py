@@ -0,0 +1,87 @@
+"""Startup import cost of utils and every extension, from ``-X importtime``.
+
+Runs the imports in a fresh interpreter twice, once as startup does it now
+and once with every :class:`LazyModule` loaded straight after, which is
+what importing them at the top of the modules used to cost.
+
+    python bench/importtime.py [top]
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+IMPORTS = """
+import importlib, sys
+sys.path.insert(0, "src")
+import utils
+for extension in utils.get_extensions():
+    importlib.import_module(extension)
+"""
+
+EAGER = """
+for module in utils.LazyModule.modules:
+    try:
+        module.load()
+    except Exception as e:
+        print(f"{module.name} not importable: {str(e).splitlines()[0]}", file=sys.stderr)
+"""
+
+
+def importtime(code: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """(module, self us) for every import, and any other stderr lines."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr)
+
+    entries = []
+    other = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            other.append(line)
+            continue
+
+        own, _, name = line[len("import time:") :].split("|")
+        if not own.strip().isdigit():
+            # the header line
+            continue
+
+        entries.append((name.strip(), int(own)))
+
+    return entries, other
+
+
+def report(name: str, code: str, top: int) -> None:
+    entries, other = importtime(code)
+    total = sum(us for _, us in entries)
+
+    # self times summed per top level package, so nothing is counted twice
+    packages: Dict[str, int] = {}
+    for module, us in entries:
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + us
+
+    print(f"{name}: {total / 1000:,.1f} ms, {len(entries)} modules")
+    for module, us in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:top]:
+        print(f"  {module:<24} {us / 1000:9.1f} ms")
+    for line in other:
+        print(f"  {line}")
+    print()
+
+
+def main(top: int) -> None:
+    print(
+        f"python {sys.version.split()[0]}, time spent in each package's own modules\n"
+    )
+    report("lazy (now)", IMPORTS, top)
+    report("eager (before)", IMPORTS + EAGER, top)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 12)
@@ -0,0 +1,90 @@
+"""Prefix resolution for 10k guilds with a few custom prefixes each.
+
+Compares building and compiling the regex on every message, like
+get_prefix used to, with the per guild matchers cached by _prefix_matcher.
+Only the matching is timed, not ``when_mentioned_or``.
+
+    python bench/prefixes.py [guilds] [messages]
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Tuple
+
+sys.path.insert(0, "src")
+
+from utils.helpers.functions import _prefix_matcher  # noqa: E402
+
+
+def old_match(bot: SimpleNamespace, guild_id: int, content: str) -> Optional[str]:
+    default = ["fish "]
+    packed = default + bot.prefixes.get(guild_id, [])
+    comp = re.compile("^(" + "|".join(map(re.escape, packed)) + ").*", flags=re.I)
+    match = comp.match(content)
+    return match.group(1) if match is not None else None
+
+
+def new_match(bot: SimpleNamespace, guild_id: int, content: str) -> Optional[str]:
+    comp, _ = _prefix_matcher(bot, guild_id)  # type: ignore
+    match = comp.match(content)
+    return match.group(0) if match is not None else None
+
+
+def run(
+    name: str,
+    match: Callable[[SimpleNamespace, int, str], Optional[str]],
+    bot: SimpleNamespace,
+    messages: List[Tuple[int, str]],
+) -> None:
+    # first pass fills whatever caches there are, the second is timed
+    for guild_id, content in messages:
+        match(bot, guild_id, content)
+
+    start = time.perf_counter()
+    for guild_id, content in messages:
+        match(bot, guild_id, content)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for guild_id, content in messages[:10_000]:
+        match(bot, guild_id, content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:<20} {elapsed / len(messages) * 1e6:8.2f} us/message"
+        f" {peak / 1024:10.1f} KiB peak over 10k messages"
+    )
+
+
+def main(guilds: int, count: int) -> None:
+    rng = random.Random(0)
+    words = ["!", "?", "f!", "fish.", "hey fish ", ">>", "$", "pls "]
+
+    bot = SimpleNamespace(testing=False, prefixes={}, prefix_matchers={})
+    for guild_id in range(guilds):
+        if rng.random() < 0.8:
+            bot.prefixes[guild_id] = rng.sample(words, rng.randint(1, 4))
+
+    messages = []
+    for _ in range(count):
+        guild_id = rng.randrange(guilds)
+        prefix = rng.choice(bot.prefixes.get(guild_id, ["fish "]) + ["", ""])
+        messages.append((guild_id, f"{prefix}hello there"))
+
+    print(f"{guilds:,} guilds, {count:,} messages, python {sys.version.split()[0]}")
+    run("compile per message", old_match, bot, messages)
+    run("cached matcher", new_match, bot, messages)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200_000,
+    )
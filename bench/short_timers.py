@@ -0,0 +1,94 @@
+"""Memory and insert cost of 50k pending short timers.
+
+Compares the old approach, one ``asyncio.sleep`` task per timer, against
+:class:`TimingWheel`. Nothing is persisted so no redis or database is needed.
+
+    python bench/short_timers.py [count]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import gc
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+from utils import PGTimer, TimingWheel  # noqa: E402
+
+
+def make_timers(count: int) -> List[PGTimer]:
+    now = datetime.datetime.utcnow()
+    return [
+        PGTimer.temporary(
+            event="reminder",
+            args=(i, 1234567890, "do the thing"),
+            kwargs={},
+            created=now,
+            expires=now + datetime.timedelta(seconds=30 + i % 30),
+        )
+        for i in range(count)
+    ]
+
+
+async def sleep_then_dispatch(seconds: float, timer: PGTimer) -> None:
+    # what CogBase.short_timer_optimisation used to do
+    await asyncio.sleep(seconds)
+
+
+async def measure(name: str, schedule: Callable[[List[PGTimer]], Any], count: int):
+    timers = make_timers(count)
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+
+    held = await schedule(timers)
+    # let every task run up to its first await
+    await asyncio.sleep(0)
+
+    elapsed = time.perf_counter() - start
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    used = after - before
+    print(
+        f"{name:<16} {used / 1024 / 1024:8.2f} MiB"
+        f" {used / count:8.0f} B/timer {elapsed * 1000:9.2f} ms to schedule"
+    )
+    return held
+
+
+async def main(count: int) -> None:
+    loop = asyncio.get_running_loop()
+
+    async def tasks(timers: List[PGTimer]) -> List[asyncio.Task]:
+        return [loop.create_task(sleep_then_dispatch(30, timer)) for timer in timers]
+
+    async def wheel(timers: List[PGTimer]) -> TimingWheel:
+        # only add() is exercised and it doesn't touch the bot without persist
+        wheel = TimingWheel(SimpleNamespace(loop=loop), key="bench")  # type: ignore
+        for timer in timers:
+            await wheel.add(timer)
+        return wheel
+
+    print(f"{count:,} pending timers, python {sys.version.split()[0]}")
+
+    held = await measure("task per timer", tasks, count)
+    for task in held:
+        task.cancel()
+    await asyncio.gather(*held, return_exceptions=True)
+    del held
+
+    held = await measure("timing wheel", wheel, count)
+    assert len(held) == count
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000))
@@ -0,0 +1,139 @@
+"""Fire throughput for 10k reminders that all expire at the same instant.
+
+Compares the old loop, one ``SELECT ... LIMIT 1`` per wake-up and one
+``DELETE`` per fired timer, against :class:`TimerManager` with its
+prefetched heap and batched deletes. Lag is how long after its expiry each
+timer was dispatched.
+
+Needs a scratch Postgres database, the migrations are applied to it like
+the bot does on start and it refuses to run if ``reminders`` has rows of
+its own, since the timer manager would fire and delete them too.
+
+    python bench/timers.py postgresql://localhost/fish_bench [count]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import statistics
+import sys
+from types import SimpleNamespace
+from typing import Any, Callable, Coroutine, List
+
+sys.path.insert(0, "src")
+
+from utils import PGTimer, TimerManager, create_pool, run_migrations  # noqa: E402
+
+# long enough for the inserts to finish before anything is due
+LEAD = 5.0
+
+
+class Fired:
+    def __init__(self, count: int):
+        self.count: int = count
+        self.lags: List[float] = []
+        self.done = asyncio.Event()
+
+    def __call__(self, timer: PGTimer) -> None:
+        self.lags.append((datetime.datetime.utcnow() - timer.expires).total_seconds())
+        if len(self.lags) >= self.count:
+            self.done.set()
+
+
+async def insert_timers(pool: Any, count: int) -> None:
+    due = datetime.datetime.utcnow() + datetime.timedelta(seconds=LEAD)
+    query = """INSERT INTO reminders (event, extra, expires, created)
+               SELECT 'bench', jsonb_build_object('args', jsonb_build_array(i), 'kwargs', '{}'::jsonb), $1, $2
+               FROM generate_series(1, $3) AS i
+            """
+    await pool.execute(query, due, datetime.datetime.utcnow(), count)
+
+
+async def old_loop(bot: SimpleNamespace, fired: Fired) -> None:
+    # CogBase.get_active_timer and call_timer before the heap
+    query = "SELECT * FROM reminders WHERE expires < (CURRENT_DATE + $1::interval) ORDER BY expires LIMIT 1;"
+    while not fired.done.is_set():
+        record = await bot.pool.fetchrow(query, datetime.timedelta(days=40))
+        if record is None:
+            await asyncio.sleep(0.1)
+            continue
+
+        timer = PGTimer(record=record)
+        now = datetime.datetime.utcnow()
+        if timer.expires >= now:
+            await asyncio.sleep((timer.expires - now).total_seconds())
+
+        await bot.pool.execute("DELETE FROM reminders WHERE id=$1;", timer.id)
+        bot.dispatch(f"{timer.event}_timer_complete", timer)
+
+
+async def heap_loop(bot: SimpleNamespace, fired: Fired) -> None:
+    manager = TimerManager(bot)  # type: ignore
+    manager.start()
+    try:
+        await fired.done.wait()
+    finally:
+        await manager.stop()
+
+
+async def measure(
+    name: str,
+    bot: SimpleNamespace,
+    count: int,
+    loop: Callable[[SimpleNamespace, Fired], Coroutine[Any, Any, None]],
+) -> None:
+    fired = Fired(count)
+    bot.dispatch = lambda event, timer: fired(timer)
+
+    task = asyncio.create_task(loop(bot, fired))
+    await insert_timers(bot.pool, count)
+    await fired.done.wait()
+    await task
+
+    # everything was due at the same instant, so the last one out marks the end
+    lags = sorted(fired.lags)
+    print(
+        f"{name:<20} {count / lags[-1]:10,.0f} fires/s"
+        f"  lag p50 {statistics.median(lags) * 1000:8.1f} ms"
+        f"  p99 {lags[int(len(lags) * 0.99) - 1] * 1000:8.1f} ms"
+        f"  max {lags[-1] * 1000:8.1f} ms"
+    )
+
+
+async def main(dsn: str, count: int) -> None:
+    bot = SimpleNamespace(
+        config={},
+        loop=asyncio.get_running_loop(),
+        logger=logging.getLogger("bench"),
+        is_closed=lambda: False,
+    )
+    await create_pool(bot, dsn)  # type: ignore
+    await run_migrations(bot.pool)
+
+    others = await bot.pool.fetchval(
+        "SELECT count(*) FROM reminders WHERE event <> 'bench'"
+    )
+    if others:
+        raise SystemExit(
+            f"reminders has {others} rows that aren't ours, use a scratch database"
+        )
+
+    await bot.pool.execute("DELETE FROM reminders WHERE event = 'bench'")
+    version = await bot.pool.fetchval("SHOW server_version")
+    print(
+        f"{count:,} timers due at once, python {sys.version.split()[0]}, postgres {version}"
+    )
+
+    await measure("query per timer", bot, count, old_loop)
+    await measure("prefetched heap", bot, count, heap_loop)
+
+    await bot.pool.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        raise SystemExit(__doc__)
+
+    asyncio.run(main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 10_000))
@@ -1,8 +1,13 @@
 import asyncio
+import sys
 
 import asyncpg
 import toml
 
+sys.path.insert(0, "src")
+
+from utils import run_migrations  # noqa: E402
+
 
 async def main():
     config = toml.load("config.toml")
@@ -10,8 +15,8 @@ async def main():
     if conn is None:
         raise asyncpg.ConnectionFailureError("Could not connect to database")
 
-    with open("schema.sql") as f:
-        await conn.execute(f.read())
+    for migration in await run_migrations(conn):
+        print(f"Applied migration {migration}")
 
     await conn.close()
 
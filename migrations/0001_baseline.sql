@@ -0,0 +1,449 @@
+CREATE TABLE IF NOT EXISTS avatars (
+    id SERIAL,
+    user_id BIGINT,
+    avatar_key TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    avatar TEXT,
+    PRIMARY KEY(user_id, avatar_key)
+);
+
+CREATE TABLE IF NOT EXISTS opted_out (
+    user_id BIGINT,
+    items TEXT[],
+    PRIMARY KEY (user_id)
+);
+
+CREATE TABLE IF NOT EXISTS guild_avatars (
+    id SERIAL,
+    member_id BIGINT,
+    guild_id BIGINT,
+    avatar_key TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    avatar TEXT,
+    PRIMARY KEY(member_id, avatar_key, guild_id)
+);
+
+CREATE TABLE IF NOT EXISTS guild_icons (
+    id SERIAL,
+    guild_id BIGINT,
+    icon_key TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    icon TEXT,
+    PRIMARY KEY(icon_key, guild_id)
+);
+
+CREATE TABLE IF NOT EXISTS username_logs (
+    id SERIAL,
+    user_id BIGINT,
+    username TEXT,
+    created_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS discrim_logs (
+    id SERIAL,
+    user_id BIGINT,
+    discrim TEXT,
+    created_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS nickname_logs (
+    id SERIAL,
+    user_id BIGINT,
+    guild_id BIGINT,
+    nickname TEXT,
+    created_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS guild_name_logs (
+    id SERIAL,
+    guild_id BIGINT,
+    name TEXT,
+    created_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS command_logs (
+    user_id BIGINT,
+    guild_id BIGINT,
+    channel_id BIGINT,
+    message_id BIGINT,
+    command TEXT,
+    created_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS uptime_logs (
+    user_id BIGINT PRIMARY KEY,
+    time TIMESTAMP WITH TIME ZONE
+);
+
+-- older tables could hold several rows per user, keep the latest one
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.table_constraints
+        WHERE table_name = 'uptime_logs' AND constraint_type = 'PRIMARY KEY'
+    ) THEN
+        DELETE FROM uptime_logs WHERE user_id IS NULL;
+        DELETE FROM uptime_logs a USING uptime_logs b
+        WHERE a.user_id = b.user_id
+        AND (COALESCE(a.time, '-infinity'), a.ctid) < (COALESCE(b.time, '-infinity'), b.ctid);
+        ALTER TABLE uptime_logs ADD PRIMARY KEY (user_id);
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS presence_sessions (
+    user_id BIGINT,
+    status TEXT,
+    started_at TIMESTAMP WITH TIME ZONE,
+    ended_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS presence_sessions_user_idx ON presence_sessions (user_id, started_at);
+
+-- seconds spent in each status per user per UTC day, rolled up from presence_sessions
+CREATE TABLE IF NOT EXISTS presence_daily (
+    user_id BIGINT,
+    day DATE,
+    status TEXT,
+    seconds INTEGER DEFAULT 0,
+    PRIMARY KEY (user_id, day, status)
+);
+
+CREATE TABLE IF NOT EXISTS member_join_logs (
+    id SERIAL,
+    member_id BIGINT,
+    guild_id BIGINT,
+    time TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS guild_settings (
+    guild_id BIGINT,
+    auto_download BIGINT,
+    poketwo BOOLEAN DEFAULT FALSE,
+    auto_reactions BOOLEAN DEFAULT FALSE,
+    PRIMARY KEY (guild_id)
+);
+
+CREATE TABLE IF NOT EXISTS guild_prefixes (
+    guild_id BIGINT,
+    prefix TEXT,
+    author_id BIGINT,
+    time TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (guild_id, prefix)
+);
+
+CREATE TABLE IF NOT EXISTS guild_join_logs (
+    guild_id BIGINT,
+    time TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS guild_bans (
+    guild_id BIGINT,
+    mod_id BIGINT,
+    target_id BIGINT,
+    reason TEXT,
+    time TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS guild_kicks (
+    guild_id BIGINT,
+    mod_id BIGINT,
+    target_id BIGINT,
+    reason TEXT,
+    time TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS accounts (
+    user_id BIGINT,
+    osu TEXT,
+    lastfm TEXT,
+    steam TEXT,
+    roblox TEXT,
+    genshin TEXT,
+    PRIMARY KEY (user_id)
+);
+
+CREATE TABLE IF NOT EXISTS tags (
+    id SERIAL,
+    guild_id BIGINT,
+    author_id BIGINT,
+    name TEXT,
+    content TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    uses BIGINT DEFAULT 0,
+    PRIMARY KEY (guild_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS table_boosters (
+    user_id BIGINT,
+    role_id BIGINT,
+    author_id BIGINT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (user_id)
+);
+
+
+CREATE TABLE IF NOT EXISTS block_list (
+    snowflake BIGINT,
+    reason TEXT,
+    time TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (snowflake)
+);
+
+CREATE TABLE IF NOT EXISTS afk (
+    user_id BIGINT,
+    reason TEXT,
+    time TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (user_id)
+);
+
+CREATE TABLE IF NOT EXISTS nsfw_covers (
+    album_id TEXT,
+    PRIMARY KEY (album_id)
+);
+
+CREATE TABLE IF NOT EXISTS pokemon_guesses (
+    pokemon_name TEXT,
+    author_id BIGINT,
+    correct BIGINT DEFAULT 0,
+    incorrect BIGINT DEFAULT 0
+);
+
+
+CREATE TABLE IF NOT EXISTS reminders (
+    id SERIAL PRIMARY KEY,
+    expires TIMESTAMP,
+    created TIMESTAMP DEFAULT (now() at time zone 'utc'),
+    event TEXT,
+    extra JSONB DEFAULT ('{}'::jsonb),
+    owner_id BIGINT
+);
+
+-- reminders made before owner_id existed kept the owner in extra->args[0]
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'reminders' AND column_name = 'owner_id'
+    ) THEN
+        ALTER TABLE reminders ADD COLUMN owner_id BIGINT;
+        UPDATE reminders SET owner_id = (extra #>> '{args,0}')::BIGINT WHERE event = 'reminder';
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS reminders_expires_idx ON reminders (expires);
+CREATE INDEX IF NOT EXISTS reminders_owner_idx ON reminders (owner_id, event, expires);
+
+CREATE OR REPLACE FUNCTION reminders_notify() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('reminders', json_build_object('op', TG_OP, 'id', OLD.id, 'expires', OLD.expires)::text);
+        RETURN OLD;
+    END IF;
+
+    PERFORM pg_notify('reminders', json_build_object('op', TG_OP, 'id', NEW.id, 'expires', NEW.expires)::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS reminders_notify_trigger ON reminders;
+CREATE TRIGGER reminders_notify_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON reminders
+    FOR EACH ROW EXECUTE FUNCTION reminders_notify();
+
+CREATE TABLE IF NOT EXISTS steam_games (
+    app_id BIGINT,
+    name TEXT,
+    PRIMARY KEY (app_id)
+);
+
+CREATE TABLE IF NOT EXISTS user_settings (
+    user_id BIGINT,
+    fm_autoreact BOOLEAN DEFAULT FALSE,
+    mudae_pokemon BOOLEAN DEFAULT FALSE,
+    PRIMARY KEY (user_id)
+);
+
+CREATE TABLE IF NOT EXISTS tatsu_rep_logs (
+    id SERIAL,
+    user_id BIGINT,
+    target_id BIGINT,
+    guild_id BIGINT,
+    created_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS guild_blocks (
+    id SERIAL,
+    author_id BIGINT,
+    guild_id BIGINT,
+    entitiy_id BIGINT,
+    created_at TIMESTAMP WITH TIME ZONE
+);
+-- row counts per logging table and UTC day, kept up to date by the triggers below
+CREATE TABLE IF NOT EXISTS log_counters (
+    name TEXT,
+    day DATE,
+    count BIGINT DEFAULT 0,
+    PRIMARY KEY (name, day)
+);
+
+CREATE OR REPLACE FUNCTION log_counters_insert() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO log_counters (name, day, count)
+    SELECT TG_ARGV[0], COALESCE((created_at AT TIME ZONE 'UTC')::DATE, 'epoch'), COUNT(*)
+    FROM new_rows GROUP BY 2
+    ON CONFLICT (name, day) DO UPDATE SET count = log_counters.count + EXCLUDED.count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION log_counters_delete() RETURNS TRIGGER AS $$
+BEGIN
+    -- rows compacted by the retention job stay counted
+    IF current_setting('fish.retention', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE log_counters SET count = log_counters.count - deleted.count
+    FROM (
+        SELECT COALESCE((created_at AT TIME ZONE 'UTC')::DATE, 'epoch') AS day, COUNT(*) AS count
+        FROM old_rows GROUP BY 1
+    ) AS deleted
+    WHERE log_counters.name = TG_ARGV[0] AND log_counters.day = deleted.day;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- the triggers are created and the counts backfilled once per table, in the same transaction
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['avatars', 'command_logs', 'username_logs', 'nickname_logs', 'discrim_logs'] LOOP
+        IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = tbl || '_count_insert') THEN
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT ON %I REFERENCING NEW TABLE AS new_rows '
+                'FOR EACH STATEMENT EXECUTE FUNCTION log_counters_insert(%L)',
+                tbl || '_count_insert', tbl, tbl
+            );
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER DELETE ON %I REFERENCING OLD TABLE AS old_rows '
+                'FOR EACH STATEMENT EXECUTE FUNCTION log_counters_delete(%L)',
+                tbl || '_count_delete', tbl, tbl
+            );
+            DELETE FROM log_counters WHERE name = tbl;
+            EXECUTE format(
+                'INSERT INTO log_counters (name, day, count) '
+                'SELECT %L, COALESCE((created_at AT TIME ZONE ''UTC'')::DATE, ''epoch''), COUNT(*) '
+                'FROM %I GROUP BY 2',
+                tbl, tbl
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+-- the append only logs are partitioned by month. Tables created before that are kept
+-- as the default partition, so nothing has to be copied over.
+CREATE OR REPLACE FUNCTION partition_log_table(tbl TEXT, col TEXT) RETURNS VOID AS $$
+DECLARE
+    legacy TEXT := tbl || '_legacy';
+    seq TEXT;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = tbl::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', tbl, legacy);
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING INDEXES) PARTITION BY RANGE (%I)',
+        tbl, legacy, col
+    );
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = legacy AND column_name = 'id'
+    ) THEN
+        seq := pg_get_serial_sequence(legacy, 'id');
+        IF seq IS NOT NULL THEN
+            EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.id', seq, tbl);
+        END IF;
+    END IF;
+
+    -- partitions can't have transition table triggers, move the counters to the parent
+    IF EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = tbl || '_count_insert' AND tgrelid = legacy::regclass) THEN
+        EXECUTE format('DROP TRIGGER %I ON %I', tbl || '_count_insert', legacy);
+        EXECUTE format('DROP TRIGGER %I ON %I', tbl || '_count_delete', legacy);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT ON %I REFERENCING NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION log_counters_insert(%L)',
+            tbl || '_count_insert', tbl, tbl
+        );
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER DELETE ON %I REFERENCING OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION log_counters_delete(%L)',
+            tbl || '_count_delete', tbl, tbl
+        );
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I DEFAULT', tbl, legacy);
+END;
+$$ LANGUAGE plpgsql;
+
+-- creates the partitions for this month and the next few, named <table>_YYYY_MM
+CREATE OR REPLACE FUNCTION ensure_log_partitions(tbl TEXT, months INTEGER DEFAULT 2) RETURNS VOID AS $$
+DECLARE
+    month DATE := date_trunc('month', now() AT TIME ZONE 'UTC')::DATE;
+    part TEXT;
+BEGIN
+    FOR i IN 0..months LOOP
+        part := tbl || '_' || to_char(month, 'YYYY_MM');
+        IF to_regclass(part) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    part, tbl,
+                    month::TIMESTAMP AT TIME ZONE 'UTC',
+                    (month + INTERVAL '1 month') AT TIME ZONE 'UTC'
+                );
+            EXCEPTION WHEN check_violation THEN
+                -- rows for this month are already in the default partition
+                NULL;
+            END;
+        END IF;
+        month := month + INTERVAL '1 month';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    log RECORD;
+BEGIN
+    FOR log IN SELECT * FROM (VALUES
+        ('command_logs', 'created_at'),
+        ('member_join_logs', 'time'),
+        ('nickname_logs', 'created_at'),
+        ('username_logs', 'created_at'),
+        ('tatsu_rep_logs', 'created_at'),
+        ('guild_join_logs', 'time'),
+        ('presence_sessions', 'started_at')
+    ) AS logs (tbl, col) LOOP
+        PERFORM partition_log_table(log.tbl, log.col);
+        PERFORM ensure_log_partitions(log.tbl);
+    END LOOP;
+END $$;
+
+CREATE INDEX IF NOT EXISTS command_logs_user_idx ON command_logs (user_id, created_at);
+CREATE INDEX IF NOT EXISTS member_join_logs_member_idx ON member_join_logs (member_id, guild_id, time);
+CREATE INDEX IF NOT EXISTS nickname_logs_user_idx ON nickname_logs (user_id, guild_id, created_at);
+CREATE INDEX IF NOT EXISTS username_logs_user_idx ON username_logs (user_id, created_at);
+CREATE INDEX IF NOT EXISTS tatsu_rep_logs_user_idx ON tatsu_rep_logs (user_id, created_at);
+CREATE INDEX IF NOT EXISTS tatsu_rep_logs_target_idx ON tatsu_rep_logs (target_id, created_at);
+CREATE INDEX IF NOT EXISTS guild_join_logs_guild_idx ON guild_join_logs (guild_id, time);
+
+-- what's left of command_logs rows once the retention job compacted them
+CREATE TABLE IF NOT EXISTS command_daily (
+    day DATE,
+    command TEXT,
+    count BIGINT DEFAULT 0,
+    PRIMARY KEY (day, command)
+);
@@ -0,0 +1,5 @@
+-- migrate: no-transaction
+-- built concurrently so the bot can keep writing logs meanwhile.
+-- If a build fails the invalid index has to be dropped before this runs again.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS discrim_logs_user_idx ON discrim_logs (user_id, created_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS guild_name_logs_guild_idx ON guild_name_logs (guild_id, created_at);
@@ -0,0 +1,9 @@
+-- spotify search results for chart covers, so lookups survive restarts.
+-- nsfw status isn't stored here, it's checked against nsfw_covers by album id.
+CREATE TABLE IF NOT EXISTS spotify_covers (
+    query TEXT,
+    album_id TEXT,
+    url TEXT,
+    fetched_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (query)
+);
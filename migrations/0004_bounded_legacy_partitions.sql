@@ -0,0 +1,97 @@
+-- the pre-partitioning tables were attached as the DEFAULT partition, which makes every
+-- new monthly partition scan all of it under an ACCESS EXCLUSIVE lock and can never be
+-- dropped by retention. They're re-attached with an upper bound instead, the month after
+-- their newest row, so they're an ordinary range partition that ages out like the rest.
+
+-- overlapping the legacy partition means that month is still covered by it
+CREATE OR REPLACE FUNCTION ensure_log_partitions(tbl TEXT, months INTEGER DEFAULT 2) RETURNS VOID AS $$
+DECLARE
+    month DATE := date_trunc('month', now() AT TIME ZONE 'UTC')::DATE;
+    part TEXT;
+BEGIN
+    FOR i IN 0..months LOOP
+        part := tbl || '_' || to_char(month, 'YYYY_MM');
+        IF to_regclass(part) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    part, tbl,
+                    month::TIMESTAMP AT TIME ZONE 'UTC',
+                    (month + INTERVAL '1 month') AT TIME ZONE 'UTC'
+                );
+            EXCEPTION WHEN invalid_object_definition THEN
+                NULL;
+            END;
+        END IF;
+        month := month + INTERVAL '1 month';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bound_legacy_partition(tbl TEXT, col TEXT) RETURNS VOID AS $$
+DECLARE
+    legacy TEXT := tbl || '_legacy';
+    newest TIMESTAMPTZ;
+    bound TIMESTAMPTZ;
+    part RECORD;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE relname = legacy AND relispartition
+        AND pg_get_expr(relpartbound, oid) = 'DEFAULT'
+    ) THEN
+        RETURN;
+    END IF;
+
+    -- range partitions can't hold NULL keys, keep the rows at the very start instead
+    EXECUTE format('UPDATE %I SET %I = ''-infinity'' WHERE %I IS NULL', legacy, col, col);
+
+    EXECUTE format('SELECT max(%I) FROM %I', col, legacy) INTO newest;
+    bound := date_trunc('month', COALESCE(newest, now()) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+        + INTERVAL '1 month';
+
+    EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', tbl, legacy);
+
+    -- a monthly partition that starts before the bound can only exist if it was
+    -- made while this was the default, its rows are folded into the legacy table
+    FOR part IN
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = tbl::regclass
+        AND substring(pg_get_expr(c.relpartbound, c.oid) FROM 'FROM \(''([^'']+)''\)')::TIMESTAMPTZ < bound
+    LOOP
+        EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', tbl, part.relname);
+        EXECUTE format('INSERT INTO %I SELECT * FROM %I', legacy, part.relname);
+        EXECUTE format('DROP TABLE %I', part.relname);
+    END LOOP;
+
+    -- lets ATTACH skip scanning the table to check the bound
+    EXECUTE format(
+        'ALTER TABLE %I ADD CONSTRAINT %I CHECK (%I IS NOT NULL AND %I < %L)',
+        legacy, legacy || '_bound', col, col, bound
+    );
+
+    EXECUTE format(
+        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (MINVALUE) TO (%L)',
+        tbl, legacy, bound
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    log RECORD;
+BEGIN
+    FOR log IN SELECT * FROM (VALUES
+        ('command_logs', 'created_at'),
+        ('member_join_logs', 'time'),
+        ('nickname_logs', 'created_at'),
+        ('username_logs', 'created_at'),
+        ('tatsu_rep_logs', 'created_at'),
+        ('guild_join_logs', 'time'),
+        ('presence_sessions', 'started_at')
+    ) AS logs (tbl, col) LOOP
+        PERFORM bound_legacy_partition(log.tbl, log.col);
+        PERFORM ensure_log_partitions(log.tbl);
+    END LOOP;
+END $$;
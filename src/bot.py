@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import importlib.machinery
 import logging
 import os
 import re
@@ -11,15 +13,26 @@ import aiohttp
 import aioredis
 import asyncpg
 import discord
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 from discord.ext import commands
 from lastfm import AsyncClient as LastfmAsyncClient
 from ossapi import OssapiV2
 
 from cogs.context import Context
 from utils import (
+    Timer,
+    LogWriter,
+    MessageRouter,
+    PokemonIndex,
+    PresenceWriter,
+    ResponseCache,
+    SetMirror,
+    TimerManager,
+    WebClient,
+    base_extensions,
     block_list,
     create_pool,
+    extension_dependencies,
     get_extensions,
     get_prefix,
     google_cooldown_check,
@@ -27,10 +40,12 @@ from utils import (
     no_auto_commands,
     no_dms,
     owner_only,
+    run_migrations,
     setup_accounts,
     setup_cache,
     setup_pokemon,
     setup_webhooks,
+    warm_up_modules,
 )
 
 if TYPE_CHECKING:
@@ -52,6 +67,13 @@ class Bot(commands.Bot):
     redis: aioredis.Redis
     exts: Set[str]
     lastfm: LastfmAsyncClient
+    timers: TimerManager
+    mirror: SetMirror
+    router: MessageRouter
+    logs: LogWriter
+    presences: PresenceWriter
+    web: WebClient
+    responses: ResponseCache
 
     def __init__(
         self,
@@ -67,7 +89,8 @@ class Bot(commands.Bot):
             strip_after_prefix=True,
             allowed_mentions=discord.AllowedMentions(everyone=False, roles=False, users=True, replied_user=False),
         )
-        self.messages: TTLCache[str, discord.Message] = TTLCache(maxsize=1000, ttl=300.0)
+        # (channel id, message id) of the invoking message -> {Context repr: response}
+        self.messages: TTLCache[Tuple[int, int], Dict[str, discord.Message]] = TTLCache(maxsize=10_000, ttl=300.0)
         self.owner_only_mode: bool = True if testing else False
 
         # webhooks
@@ -82,17 +105,24 @@ class Bot(commands.Bot):
 
         # config
         self.exts = set(initial_extensions + get_extensions())
-        self.cached_covers: Dict[str, Tuple[str, bool]] = {}
+        # extension -> (import time, total load time) in seconds
+        self.extension_timings: Dict[str, Tuple[float, float]] = {}
+        # extension -> seconds spent executing its module, see _load_from_module_spec
+        self._import_timings: Dict[str, float] = {}
+        # spotify search query -> (album id, cover url), backed by spotify_covers
+        self.cached_covers: LRUCache[str, Tuple[str, str]] = LRUCache(maxsize=5_000)
         self.prefixes: Dict[int, List[str]] = {}
+        self.prefix_matchers: Dict[Optional[int], Tuple[re.Pattern[str], List[str]]] = {}
         self.current_downloads: List[str] = []
         self.spotify_key: Optional[str] = None
         self.config: Dict[str, Any] = config
         self.uptime: datetime.datetime
-        self.pokemon: List[str] = []
+        self.pokemon: PokemonIndex = PokemonIndex([])
         self.embedcolor = 0xFAA0C1
         self._context = Context
         self.testing = testing
         self.logger = logger
+        self.router = MessageRouter(self)
 
         # checks
         self.add_check(no_dms)
@@ -126,6 +156,10 @@ class Bot(commands.Bot):
         embed.timestamp = discord.utils.utcnow()
         await self.webhooks["error_logs"].send(embed=embed)
 
+    async def on_message(self, message: discord.Message) -> None:
+        self.router.route(message)
+        await self.process_commands(message)
+
     async def on_message_edit(
         self, before: discord.Message, after: discord.Message
     ) -> None:
@@ -136,26 +170,70 @@ class Bot(commands.Bot):
         await self.process_commands(after)
 
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
-        _repr_regex = rf"<utils\.Context bound to message \({payload.channel_id}-{payload.message_id}-[0-9]+\)>"
-        pattern = re.compile(_repr_regex)
-        messages = {r: m for r, m in self.messages.items() if pattern.fullmatch(r)}
-        for _repr, message in messages.items():
+        responses = self.messages.pop((payload.channel_id, payload.message_id), {})
+        for message in responses.values():
             try:
                 await message.delete()
             except discord.HTTPException:
                 pass
-            try:
-                del self.messages[_repr]
-            except KeyError:
-                pass
 
-    async def load_extensions(self):
-        for extension in self.exts if not self.testing else initial_extensions:
-            try:
+    async def _load_from_module_spec(
+        self, spec: importlib.machinery.ModuleSpec, key: str
+    ) -> None:
+        # load_extension executes the module through the spec's loader and
+        # then awaits setup, timing the loader call splits the two apart
+        # without importing the module a second time
+        loader = spec.loader
+        if loader is not None:
+            exec_module = loader.exec_module
+
+            def timed_exec_module(module: Any) -> None:
+                with Timer() as imported:
+                    exec_module(module)
+                self._import_timings[key] = imported.time
+
+            loader.exec_module = timed_exec_module  # type: ignore
+
+        await super()._load_from_module_spec(spec, key)
+
+    async def _load_timed(self, extension: str, after: List[asyncio.Task]) -> None:
+        if after:
+            await asyncio.wait(after)
+
+        try:
+            with Timer() as total:
                 await self.load_extension(extension)
-                self.logger.info(f"Loaded extension {extension}")
-            except Exception as e:
-                self.logger.warn(f"Failed to load {extension}: {e}")
+        except Exception as e:
+            self.logger.warning(f"Failed to load {extension}: {e}")
+            return
+
+        imported = self._import_timings.pop(extension, 0.0)
+        self.extension_timings[extension] = (imported, total.time)
+        self.logger.info(f"Loaded extension {extension} in {total.time * 1000:.2f}ms")
+
+    async def load_extensions(self):
+        extensions = self.exts if not self.testing else set(initial_extensions)
+        tasks: Dict[str, asyncio.Task] = {}
+
+        # every extension starts as soon as the ones it depends on are done
+        def schedule(extension: str) -> asyncio.Task:
+            if extension not in tasks:
+                needs = [] if extension in base_extensions else list(base_extensions)
+                needs += extension_dependencies.get(extension, [])
+                after = [schedule(e) for e in needs if e in extensions]
+                tasks[extension] = asyncio.create_task(
+                    self._load_timed(extension, after)
+                )
+
+            return tasks[extension]
+
+        for extension in extensions:
+            schedule(extension)
+
+        with Timer() as timer:
+            await asyncio.gather(*tasks.values())
+
+        self.logger.info(f"Loaded {len(self.extension_timings)} extensions in {timer.time:.2f}s")
 
     async def unload_extensions(self):
         for extension in self.exts if not self.testing else initial_extensions:
@@ -175,6 +253,7 @@ class Bot(commands.Bot):
 
     async def setup_hook(self):
         self.session = aiohttp.ClientSession()
+        self.web = WebClient(self)
 
         await create_pool(
             self,
@@ -183,8 +262,8 @@ class Bot(commands.Bot):
             else self.config["databases"]["psql"],
         )
 
-        with open("schema.sql", "r") as f:
-            await self.pool.execute(f.read())
+        for migration in await run_migrations(self.pool):
+            self.logger.info(f"Applied migration {migration}")
 
         self.redis = await aioredis.from_url(
             self.config["databases"]["testing_redis_dns"]
@@ -195,12 +274,21 @@ class Bot(commands.Bot):
         )
 
         # fmt:off
+        self.responses = ResponseCache(self)
         self.lastfm = LastfmAsyncClient(self.config["keys"]["lastfm-key"], session=self.session)
         self.osu = OssapiV2(self.config["keys"]["osu-id"], self.config["keys"]["osu-secret"])
         await setup_cache(self)
+        self.mirror = SetMirror(self)
+        await self.mirror.start()
         await setup_webhooks(self)
         await setup_pokemon(self)
         await setup_accounts(self)
+        self.timers = TimerManager(self)
+        self.timers.start()
+        self.logs = LogWriter(self)
+        self.logs.start()
+        self.presences = PresenceWriter(self)
+        self.presences.start()
         await self.load_extensions()
         # fmt:on
 
@@ -211,11 +299,17 @@ class Bot(commands.Bot):
     async def on_ready(self):
         if not hasattr(self, "uptime"):
             self.uptime = discord.utils.utcnow()
+            # the heavy imports were skipped at startup, load them now
+            self.loop.create_task(warm_up_modules())
 
         self.logger.info(f"Logged in as {self.user}")
 
     async def close(self):
         await self.unload_extensions()
+        await self.timers.stop()
+        await self.mirror.stop()
+        await self.presences.stop()
+        await self.logs.stop()
 
         await self.session.close()
         await self.pool.close()
@@ -96,9 +96,6 @@ class Context(commands.Context):
         self.redis = self.bot.redis
         self._db: Optional[Union[Pool, Connection]] = None
         self._message_count: int = 0
-        self.dagpi_rl = commands.CooldownMapping.from_cooldown(
-            60.0, 60.0, commands.BucketType.default
-        )
 
     @property
     def db(self) -> Union[Pool, Connection]:
@@ -237,17 +234,8 @@ class Context(commands.Context):
     async def dagpi(self, url: str) -> Dict[str, str]:
         from utils import RateLimitExceeded, response_checker
 
-        bucket = self.dagpi_rl.get_bucket(self.message)
-        if bucket is None:
-            raise RateLimitExceeded()
-
-        retry_after = bucket.update_rate_limit()
-
-        if retry_after:
-            raise RateLimitExceeded()
-
         headers = {"Authorization": self.bot.config["keys"]["dagpi"]}
-        async with self.session.get(url, headers=headers) as r:
+        async with self.bot.web.get(url, headers=headers, wait=False) as r:
             if r.status == 429:
                 raise RateLimitExceeded()
 
@@ -266,17 +254,25 @@ class Context(commands.Context):
     @property
     def _previous_message(self) -> Optional[discord.Message]:
         if self.message:
-            try:
-                return self.bot.messages[repr(self)]
-            except KeyError:
-                return None
+            key = (self.channel.id, self.message.id)
+            return self.bot.messages.get(key, {}).get(repr(self))
 
     @_previous_message.setter
     def _previous_message(self, message: Optional[discord.Message]) -> None:
+        if not self.message:
+            return
+
+        # responses are grouped under the invoking message so deleting it
+        # finds them with a single lookup
+        key = (self.channel.id, self.message.id)
+        responses = self.bot.messages.get(key, {})
+
         if isinstance(message, discord.Message):
-            self.bot.messages[repr(self)] = message
+            responses[repr(self)] = message
+            # re-set so the entry's ttl starts over
+            self.bot.messages[key] = responses
         else:
-            self.bot.messages.pop(repr(self), None)
+            responses.pop(repr(self), None)
 
     def __repr__(self) -> str:
         if self.message:
@@ -20,7 +20,8 @@ from utils import (
     UserInfoView,
     format_status,
     get_user_badges,
-    to_bytes,
+    grid_size,
+    thumbnails,
     format_bytes,
     BlankException,
     Pager,
@@ -73,9 +74,11 @@ class InfoCommands(CogBase):
                     f'{REPLY}{discord.utils.format_dt(user.joined_at, "D")}\n',
                 )
 
-            results: Optional[datetime.datetime] = await self.bot.pool.fetchval(
-                "SELECT time FROM uptime_logs WHERE user_id = $1", user.id
-            )
+            results = self.bot.presences.last_seen(user.id)
+            if results is None:
+                results = await self.bot.pool.fetchval(
+                    "SELECT time FROM uptime_logs WHERE user_id = $1", user.id
+                )
             formatted = (
                 f'{discord.utils.format_dt(results, "D")}\n{REPLY}{discord.utils.format_dt(results, "R")}'
                 if results
@@ -401,8 +404,12 @@ class InfoCommands(CogBase):
             if records == []:
                 raise BlankException(f"{guild} has no icon history on record.")
 
+            size = grid_size(len(records))
             icons = await asyncio.gather(
-                *[to_bytes(ctx.session, row["icon"]) for row in records]
+                *[
+                    thumbnails.get(ctx.session, row["icon"], (size, size))
+                    for row in records
+                ]
             )
 
             fp = await format_bytes(ctx.guild.filesize_limit, icons)
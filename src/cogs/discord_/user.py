@@ -16,7 +16,8 @@ from utils import (
     Pager,
     format_bytes,
     human_timedelta,
-    to_bytes,
+    grid_size,
+    thumbnails,
     format_status,
     BlankException,
 )
@@ -108,6 +109,10 @@ class UserCommands(CogBase):
         await ctx.send(file=file, embed=embed)
 
     async def _index_member(self, guild: discord.Guild, member: discord.Member) -> bool:
+        # the log partitions are by time, there's nowhere to put a row without one
+        if member.joined_at is None:
+            return False
+
         sql = """
         INSERT INTO member_join_logs (member_id, guild_id, time)
         SELECT $1, $2, $3
@@ -173,12 +178,14 @@ class UserCommands(CogBase):
                 f"Hello, I have been awake for {human_timedelta(bot.uptime, suffix=False)}."
             )
 
-        if "uptime" in await self.bot.redis.smembers(f"opted_out:{member.id}"):
+        if self.bot.mirror.contains(f"opted_out:{member.id}", "uptime"):
             raise BlankException(f"Sorry, {member} has opted out from uptime logging.")
 
-        results: Optional[datetime.datetime] = await bot.pool.fetchval(
-            "SELECT time FROM uptime_logs WHERE user_id = $1", member.id
-        )
+        results: Optional[datetime.datetime] = bot.presences.last_seen(member.id)
+        if results is None:
+            results = await bot.pool.fetchval(
+                "SELECT time FROM uptime_logs WHERE user_id = $1", member.id
+            )
 
         message = (
             f"{member} has been {format_status(member)} for {human_timedelta(results, suffix=False)}."
@@ -188,6 +195,31 @@ class UserCommands(CogBase):
 
         await ctx.send(message)
 
+    @commands.command(name="onlinetime", aliases=("ot",))
+    async def onlinetime(
+        self, ctx: Context, member: discord.Member = commands.Author, days: int = 7
+    ):
+        """Shows how long a user spent in each status recently."""
+        if self.bot.mirror.contains(f"opted_out:{member.id}", "uptime"):
+            raise BlankException(f"Sorry, {member} has opted out from uptime logging.")
+
+        days = min(max(days, 1), 365)
+        totals = await self.bot.presences.online_time(member.id, days)
+
+        if not totals:
+            return await ctx.send(f"I have no status records for {member} yet.")
+
+        online = sum(seconds for status, seconds in totals.items() if status != "offline")
+        lines = [
+            f"**{status}**: {seconds / 3600:,.1f} hours"
+            for status, seconds in sorted(totals.items(), key=lambda s: -s[1])
+        ]
+
+        await ctx.send(
+            f"{member} was online for {online / 3600:,.1f} hours in the last {days} day{'s' if days > 1 else ''}.\n"
+            + "\n".join(lines)
+        )
+
     @commands.command(name="usernames", aliases=("names",))
     async def usernames(self, ctx: Context, user: discord.User = commands.Author):
 
@@ -305,8 +337,12 @@ class UserCommands(CogBase):
                 await ctx.send(f"{user} has no avatar history on record.")
                 return
 
+            size = grid_size(len(records))
             avatars = await asyncio.gather(
-                *[to_bytes(ctx.session, row["avatar"]) for row in records]
+                *[
+                    thumbnails.get(ctx.session, row["avatar"], (size, size))
+                    for row in records
+                ]
             )
 
             fp = await format_bytes(ctx.guild.filesize_limit, avatars)
@@ -358,8 +394,12 @@ class UserCommands(CogBase):
             if records == []:
                 raise ValueError(f"{member} has no server avatar history on record.")
 
+            size = grid_size(len(records))
             avatars = await asyncio.gather(
-                *[to_bytes(ctx.session, row["avatar"]) for row in records]
+                *[
+                    thumbnails.get(ctx.session, row["avatar"], (size, size))
+                    for row in records
+                ]
             )
 
             gen_start = time.perf_counter()
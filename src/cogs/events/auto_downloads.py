@@ -23,23 +23,8 @@ class AutoDownloads(commands.Cog, name="auto_downloads"):
             1, 5, commands.BucketType.member
         )
 
-    @commands.Cog.listener("on_message")
+    @commands.Cog.listener("on_auto_download_message")
     async def on_message(self, message: discord.Message):
-        blocked = await self.bot.redis.smembers("block_list")
-        if (
-            message.guild is None
-            or message.author.bot
-            or isinstance(message.guild.me, discord.Member)
-            and not message.channel.permissions_for(message.guild.me).send_messages
-            or message.author.id == message.guild.me.id
-            or not str(message.channel.id)
-            in await self.bot.redis.smembers("auto_download_channels")
-            or str(message.author.id) in blocked
-            or str(message.guild.owner_id) in blocked
-            or str(message.guild.id) in blocked
-        ):
-            return
-
         bucket = self.cd_mapping.get_bucket(message)
 
         if bucket is None:
@@ -25,23 +25,9 @@ class AutoReactions(commands.Cog, name="auto_reactions"):
             except:  # bare except cuz i dont really need anything to happen nor will this failing raise any suspicion
                 pass
 
-    @commands.Cog.listener("on_message")
+    @commands.Cog.listener("on_auto_reaction_message")
     async def on_message(self, message: discord.Message):
-        if message.guild is None:
-            return
-        if message.author.bot:
-            return
-        if str(message.guild.id) not in await self.bot.redis.smembers("auto_reactions"):
-            return
-
-        if message.attachments:
-            return await self.add_reactions(message)
-
-        embeds = message.embeds
-
-        for embed in embeds:
-            if embed.type != "rich":
-                return await self.add_reactions(message)
+        await self.add_reactions(message)
 
     @commands.Cog.listener("on_message_edit")
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
@@ -49,7 +35,7 @@ class AutoReactions(commands.Cog, name="auto_reactions"):
             return
         if before.author.bot:
             return
-        if str(before.guild.id) not in await self.bot.redis.smembers("auto_reactions"):
+        if not self.bot.mirror.contains("auto_reactions", before.guild.id):
             return
 
         if after.attachments:
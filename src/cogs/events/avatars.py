@@ -69,7 +69,7 @@ class AvatarEvents(commands.Cog, name="avatar_events"):
         if user.avatar is None:
             return
 
-        if "avatars" in await self.bot.redis.smembers(f"opted_out:{user.id}"):
+        if self.bot.mirror.contains(f"opted_out:{user.id}", "avatars"):
             return
 
         message = await self.do_avatar(user=user, asset=user.avatar)
@@ -94,7 +94,7 @@ class AvatarEvents(commands.Cog, name="avatar_events"):
         if member.guild_avatar is None:
             return
 
-        if "guild_avatars" in await self.bot.redis.smembers(f"opted_out:{member.id}"):
+        if self.bot.mirror.contains(f"opted_out:{member.id}", "guild_avatars"):
             return
 
         message = await self.do_avatar(user=member, asset=member.guild_avatar)
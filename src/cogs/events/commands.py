@@ -22,13 +22,16 @@ class CommandEvents(commands.Cog, name="command_events"):
         if ctx.command is None:
             return
 
-        sql = """
-        INSERT INTO command_logs(user_id, guild_id, channel_id, message_id, command, created_at)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        """
-
-        await self.bot.pool.execute(
-            sql,
+        self.bot.logs.add(
+            "command_logs",
+            (
+                "user_id",
+                "guild_id",
+                "channel_id",
+                "message_id",
+                "command",
+                "created_at",
+            ),
             ctx.author.id,
             ctx.guild.id,
             ctx.channel.id,
@@ -6,9 +6,15 @@ from typing import TYPE_CHECKING, Any, Union
 
 import discord
 from discord.ext import commands
-from yt_dlp import DownloadError
 
-from utils import IGNORED, SEND, RateLimitExceeded, DevError, get_or_fetch_user
+from utils import (
+    IGNORED,
+    SEND,
+    RateLimitExceeded,
+    DevError,
+    get_or_fetch_user,
+    yt_dlp,
+)
 
 if TYPE_CHECKING:
     from bot import Bot
@@ -91,7 +97,8 @@ class ErrorEvents(commands.Cog, name="error_events"):
             except:
                 pass
 
-        if isinstance(error, DownloadError):
+        # nothing can raise it before yt_dlp was imported
+        if yt_dlp.loaded and isinstance(error, yt_dlp.DownloadError):
             # await self.bot.post_error(ctx, excinfo)
             return await ctx.send(
                 "Sorry, something went wrong while downloading, try again later?"
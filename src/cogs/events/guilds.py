@@ -26,15 +26,15 @@ class GuildEvents(commands.Cog, name="guild_events"):
 
     @commands.Cog.listener("on_member_join")
     async def on_member_join(self, member: discord.Member):
-        if "joins" in await self.bot.redis.smembers(f"opted_out:{member.id}"):
+        if self.bot.mirror.contains(f"opted_out:{member.id}", "joins"):
             return
 
-        sql = """
-        INSERT INTO member_join_logs(member_id, guild_id, time)
-        VALUES ($1, $2, $3)
-        """
-        await self.bot.pool.execute(
-            sql, member.id, member.guild.id, discord.utils.utcnow()
+        self.bot.logs.add(
+            "member_join_logs",
+            ("member_id", "guild_id", "time"),
+            member.id,
+            member.guild.id,
+            discord.utils.utcnow(),
         )
 
     @commands.Cog.listener("on_member_ban")
@@ -94,8 +94,7 @@ class GuildEvents(commands.Cog, name="guild_events"):
         if self.bot.user is None:
             return
 
-        banned_guilds = await self.bot.redis.smembers("block_list")
-        if str(guild.id) in banned_guilds:
+        if self.bot.mirror.contains("block_list", guild.id):
             await guild.leave()
             return
 
@@ -124,8 +123,7 @@ class GuildEvents(commands.Cog, name="guild_events"):
         if self.bot.user is None:
             return
 
-        banned_guilds = await self.bot.redis.smembers("block_list")
-        if str(guild.id) in banned_guilds:
+        if self.bot.mirror.contains("block_list", guild.id):
             return
 
         embed = discord.Embed(
@@ -144,9 +142,13 @@ class GuildEvents(commands.Cog, name="guild_events"):
         if before.name == after.name:
             return
 
-        sql = """INSERT INTO guild_name_logs (guild_id, name, created_at) VALUES($1,$2,$3)"""
-
-        await self.bot.pool.execute(sql, after.id, after.name, discord.utils.utcnow())
+        self.bot.logs.add(
+            "guild_name_logs",
+            ("guild_id", "name", "created_at"),
+            after.id,
+            after.name,
+            discord.utils.utcnow(),
+        )
 
     async def post_file(
         self,
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, List
 import discord
 from discord.ext import commands
 
-from utils import BOT_MENTION_RE, get_pokemon
+from utils import get_pokemon
 
 if TYPE_CHECKING:
     from bot import Bot
@@ -24,17 +24,11 @@ class MessageEvents(commands.Cog, name="message_event"):
         self.bot = bot
         self.counter: List[int] = []
 
-    @commands.Cog.listener("on_message")
+    @commands.Cog.listener("on_bot_mention")
     async def on_mention(self, message: discord.Message):
         if message.channel.id in self.counter:
             return
 
-        if message.guild is None:
-            return
-
-        if not BOT_MENTION_RE.fullmatch(message.content):
-            return
-
         to_send = f"""
         Hey there, im fishie, a somewhat multipurpose bot but I mainly am focused on logging stuff.
 
@@ -61,20 +55,8 @@ class MessageEvents(commands.Cog, name="message_event"):
         except ValueError:
             pass
 
-    @commands.Cog.listener("on_message")
+    @commands.Cog.listener("on_poketwo_hint")
     async def pokemon_hint(self, message: discord.Message):
-        if (
-            message.guild is None
-            or message.author.id != 716390085896962058
-            or str(message.guild.id)
-            not in await self.bot.redis.smembers("poketwo_guilds")
-            or str(message.guild.owner_id)
-            in await self.bot.redis.smembers("block_list")
-            or str(message.guild.id) in await self.bot.redis.smembers("block_list")
-            or r"\_" not in message.content
-        ):
-            return
-
         to_search = re.match(
             r'the pokémon is (?P<pokemon>[^"]+).', message.content.lower()
         )
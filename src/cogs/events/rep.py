@@ -36,13 +36,9 @@ class Rep(commands.Cog, name="rep"):
         if user_id is None:
             return
 
-        sql = """
-        INSERT INTO tatsu_rep_logs(user_id, target_id, guild_id, created_at)
-        VALUES($1, $2, $3, $4)
-        """
-
-        await self.bot.pool.execute(
-            sql,
+        self.bot.logs.add(
+            "tatsu_rep_logs",
+            ("user_id", "target_id", "guild_id", "created_at"),
             message.interaction.user.id,
             int(user_id.group(0)),
             message.guild.id,
@@ -107,23 +103,19 @@ class Rep(commands.Cog, name="rep"):
         else:
             user_id = members[0].id
 
-        sql = """
-        INSERT INTO tatsu_rep_logs(user_id, target_id, guild_id, created_at)
-        VALUES($1, $2, $3, $4)
-        """
-
-        await self.bot.pool.execute(
-            sql,
+        self.bot.logs.add(
+            "tatsu_rep_logs",
+            ("user_id", "target_id", "guild_id", "created_at"),
             user_id,
             target_id,
             message.guild.id,
             discord.utils.utcnow(),
         )
 
-    @commands.Cog.listener("on_message")
+    @commands.Cog.listener("on_tatsu_message")
     async def interaction_rep(self, message: discord.Message):
         await self.from_interaction(message)
 
-    @commands.Cog.listener("on_message")
+    @commands.Cog.listener("on_tatsu_message")
     async def message_rep(self, message: discord.Message):
         await self.from_message(message)
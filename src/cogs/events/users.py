@@ -21,67 +21,56 @@ class UserEvents(commands.Cog, name="user_events"):
 
     @commands.Cog.listener("on_member_update")
     async def on_nickname_update(self, before: discord.Member, after: discord.Member):
-        if "nicknames" in await self.bot.redis.smembers(f"opted_out:{after.id}"):
+        if self.bot.mirror.contains(f"opted_out:{after.id}", "nicknames"):
             return
 
         if before.nick != after.nick:
             if after.nick is None:
                 return
 
-            sql = """
-            INSERT INTO nickname_logs(user_id, guild_id, nickname, created_at)
-            VALUES ($1, $2, $3, $4)
-            """
-            await self.bot.pool.execute(
-                sql, after.id, after.guild.id, after.nick, discord.utils.utcnow()
+            self.bot.logs.add(
+                "nickname_logs",
+                ("user_id", "guild_id", "nickname", "created_at"),
+                after.id,
+                after.guild.id,
+                after.nick,
+                discord.utils.utcnow(),
             )
 
     @commands.Cog.listener("on_user_update")
     async def on_username_update(self, before: discord.User, after: discord.User):
-        if "usernames" in await self.bot.redis.smembers(f"opted_out:{after.id}"):
+        if self.bot.mirror.contains(f"opted_out:{after.id}", "usernames"):
             return
 
         if before.name != after.name:
-            sql = """
-            INSERT INTO username_logs(user_id, username, created_at)
-            VALUES ($1, $2, $3)
-            """
-            await self.bot.pool.execute(
-                sql, after.id, after.name, datetime.datetime.utcnow()
+            self.bot.logs.add(
+                "username_logs",
+                ("user_id", "username", "created_at"),
+                after.id,
+                after.name,
+                datetime.datetime.utcnow(),
             )
 
     @commands.Cog.listener("on_user_update")
     async def on_discrim_update(self, before: discord.User, after: discord.User):
-        if "discrims" in await self.bot.redis.smembers(f"opted_out:{after.id}"):
+        if self.bot.mirror.contains(f"opted_out:{after.id}", "discrims"):
             return
 
         if before.discriminator != after.discriminator:
-            sql = """
-            INSERT INTO discrim_logs(user_id, discrim, created_at)
-            VALUES ($1, $2, $3)
-            """
-            await self.bot.pool.execute(
-                sql, after.id, after.discriminator, datetime.datetime.utcnow()
+            self.bot.logs.add(
+                "discrim_logs",
+                ("user_id", "discrim", "created_at"),
+                after.id,
+                after.discriminator,
+                datetime.datetime.utcnow(),
             )
 
     @commands.Cog.listener("on_presence_update")
     async def on_status_update(self, before: discord.Member, after: discord.Member):
         if before.status != after.status:
-            if "uptime" in await self.bot.redis.smembers(f"opted_out:{after.id}"):
-                return
-            results = await self.bot.pool.fetchrow(
-                "SELECT user_id FROM uptime_logs WHERE user_id = $1", after.id
-            )
-
-            if results is None:
-                sql = """
-                INSERT INTO uptime_logs(user_id, time)
-                VALUES($1, $2)"""
-                await self.bot.pool.execute(sql, after.id, discord.utils.utcnow())
+            if self.bot.mirror.contains(f"opted_out:{after.id}", "uptime"):
                 return
 
-            sql = """
-            UPDATE uptime_logs
-            SET time = $2 WHERE user_id = $1
-            """
-            await self.bot.pool.execute(sql, after.id, discord.utils.utcnow())
+            self.bot.presences.update(
+                after.id, str(after.status), discord.utils.utcnow()
+            )
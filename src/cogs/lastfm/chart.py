@@ -12,11 +12,9 @@ from .functions import *
 from utils import (
     LastfmConverter,
     LastfmTimeConverter,
+    Timer,
     get_lastfm,
-    get_sp_cover,
-    to_bytes,
-    to_bytesio,
-    NoCover,
+    grid_size,
     lastfm_period,
     shorten,
     format_bytes,
@@ -43,32 +41,29 @@ class Chart(CogBase):
         )
 
         async with ctx.typing():
-            albums = await get_top_albums(self.bot, period, name)
+            timings: Dict[str, float] = {}
 
-            image_data: List[Tuple[BytesIO, str]] = []
+            with Timer() as timer:
+                albums = await get_top_albums(self.bot, period, name)
+            timings["albums"] = timer.time
 
-            total = 0
-            chart_nsfw = False
-            for album in albums:
-                if total == 9:
-                    break
-                try:
-                    query = f"{album['name']} {album['artist']['name']}"
-                    url, nsfw = await get_sp_cover(self.bot, query)
+            with Timer() as timer:
+                covers, chart_nsfw = await fetch_covers(
+                    self.bot, albums, 9, size=(200, 200)
+                )
+            timings["covers"] = timer.time
 
-                    cover = await to_bytesio(ctx.session, url)
-                    image_data.append((cover, shorten(album["name"], 15, ending="...")))
+            image_data = [
+                (cover, shorten(album["name"], 15, ending="..."))
+                for album, cover in covers
+            ]
 
-                    if nsfw:
-                        chart_nsfw = True
+            with Timer() as timer:
+                image = await make_chart(image_data, name)
+            timings["render"] = timer.time
 
-                    total += 1
-                except (IndexError, NoCover):
-                    continue
-
-            image = await make_chart(image_data, name)
             file = discord.File(image, filename="chart.png", spoiler=chart_nsfw)
-            text = f"Top {lastfm_period[period]} albums chart for {name}"
+            text = f"Top {lastfm_period[period]} albums chart for {name}\n{format_timings(timings)}"
 
             # if random.randint(1, 10) == 5:
             #    text += "\nWant a different chart? Try chart classic or chart advanced!"
@@ -90,36 +85,29 @@ class Chart(CogBase):
         )
 
         async with ctx.typing():
-            albums = await get_top_albums(self.bot, period, name)
-
-            urls: List[str] = []
+            timings: Dict[str, float] = {}
 
-            total = 0
-            chart_nsfw = False
-            for album in albums:
-                if total == 9:
-                    break
-                try:
-                    query = f"{album['name']} {album['artist']['name']}"
-                    url, nsfw = await get_sp_cover(self.bot, query)
+            with Timer() as timer:
+                albums = await get_top_albums(self.bot, period, name)
+            timings["albums"] = timer.time
 
-                    urls.append(url)
+            with Timer() as timer:
+                size = grid_size(9)
+                covers, chart_nsfw = await fetch_covers(
+                    self.bot, albums, 9, size=(size, size), decode=False
+                )
+            timings["covers"] = timer.time
 
-                    if nsfw:
-                        chart_nsfw = True
+            with Timer() as timer:
+                images: List[bytes] = [cover for _, cover in covers]
+                image = await format_bytes(ctx.guild.filesize_limit, images)
+            timings["render"] = timer.time
 
-                    total += 1
-                except (IndexError, NoCover):
-                    continue
-
-            images: List[bytes] = await asyncio.gather(
-                *[to_bytes(ctx.session, url) for url in urls]
-            )
-            image = await format_bytes(ctx.guild.filesize_limit, images)
             file = discord.File(image, filename="chart.png", spoiler=chart_nsfw)
 
             await ctx.send(
-                f"Top {lastfm_period[period]} albums chart for {name}", file=file
+                f"Top {lastfm_period[period]} albums chart for {name}\n{format_timings(timings)}",
+                file=file,
             )
 
     @chart.command(name="advanced", aliases=("a",), invoke_without_command=True)
@@ -139,35 +127,32 @@ class Chart(CogBase):
         )
 
         async with ctx.typing():
-            albums = await get_top_albums(self.bot, period, name)
-
-            image_data: List[Tuple[BytesIO, str]] = []
-
-            chart_nsfw = False
-            for index, album in enumerate(albums):
-                if index == 50:
-                    break
-
-                try:
-                    query = f"{album['name']} {album['artist']['name']}"
-                    url, nsfw = await get_sp_cover(self.bot, query)
+            timings: Dict[str, float] = {}
 
-                    image = await to_bytesio(ctx.session, url)
-                    image_data.append(
-                        (image, f"{album['artist']['name']} - {album['name']}")
-                    )
+            with Timer() as timer:
+                albums = await get_top_albums(self.bot, period, name)
+            timings["albums"] = timer.time
 
-                    if nsfw:
-                        chart_nsfw = True
+            # the biggest slot is 150x150, smaller ones are scaled down from that
+            # when the chart is put together
+            with Timer() as timer:
+                covers, chart_nsfw = await fetch_covers(
+                    self.bot, albums, 50, size=(150, 150), fill=False
+                )
+            timings["covers"] = timer.time
 
-                except (IndexError, NoCover):
-                    continue
+            image_data = [
+                (cover, f"{album['artist']['name']} - {album['name']}")
+                for album, cover in covers
+            ]
 
-            image = await make_advanced_chart(image_data)
+            with Timer() as timer:
+                image = await make_advanced_chart(image_data)
+            timings["render"] = timer.time
 
             file = discord.File(image, filename="chart.png", spoiler=chart_nsfw)
 
         await ctx.send(
-            f"Top 50 {lastfm_period[period]} albums chart for {name}\nThis command is not finished yet, work in progress.",
+            f"Top 50 {lastfm_period[period]} albums chart for {name}\nThis command is not finished yet, work in progress.\n{format_timings(timings)}",
             file=file,
         )
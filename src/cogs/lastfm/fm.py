@@ -66,7 +66,7 @@ class FmCommand(CogBase):
         embed.set_footer(text=footer_text)
         message = await ctx.send(embed=embed, check_ref=True)
 
-        if str(ctx.author.id) in await self.bot.redis.smembers("fm_autoreactions"):
+        if self.bot.mirror.contains("fm_autoreactions", ctx.author.id):
             emojis = [UPVOTE, DOWNVOTE]
             for emoji in emojis:
                 try:
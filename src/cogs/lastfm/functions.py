@@ -1,19 +1,101 @@
 from __future__ import annotations
 
+import asyncio
 import itertools
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from PIL import Image, ImageDraw, ImageFont
-
-from utils import BlankException, to_thread, get_lastfm_data
+from utils import BlankException, ImageDraw, ImageFont, NoCover
+from utils import PImage as Image
+from utils import get_lastfm_data, get_sp_cover, thumbnails, to_bytes, to_thread
 
 if TYPE_CHECKING:
     from bot import Bot
 
 
 @to_thread
-def make_chart(data: List[Tuple[BytesIO, str]], name: str):
+def open_cover(data: bytes) -> Any:
+    cover = Image.open(BytesIO(data))
+    cover.load()
+    return cover
+
+
+async def _fetch_cover(
+    bot: Bot,
+    album: Dict[str, Any],
+    size: Optional[Tuple[int, int]],
+    decode: bool,
+    semaphore: asyncio.Semaphore,
+) -> Tuple[Any, bool]:
+    async with semaphore:
+        query = f"{album['name']} {album['artist']['name']}"
+        url, nsfw = await get_sp_cover(bot, query)
+
+        if size is None:
+            return await to_bytes(bot.session, url), nsfw
+
+        data = await thumbnails.get(bot.session, url, size)
+
+    if not decode:
+        return data, nsfw
+
+    # decoded while the other covers are still downloading
+    return await open_cover(data), nsfw
+
+
+async def fetch_covers(
+    bot: Bot,
+    albums: List[Dict[str, Any]],
+    amount: int,
+    *,
+    size: Optional[Tuple[int, int]] = None,
+    decode: bool = True,
+    fill: bool = True,
+    concurrency: int = 8,
+) -> Tuple[List[Tuple[Dict[str, Any], Any]], bool]:
+    """Looks up and downloads covers for the first ``amount`` albums at once.
+
+    Albums without a cover are skipped, with ``fill`` the ones after them
+    are tried until there are ``amount`` covers. With ``size`` covers come
+    from the thumbnail cache at that size, opened unless ``decode`` is off,
+    otherwise they're the full size bytes. They're returned in album order
+    along with whether any of them is nsfw.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    covers: List[Tuple[Dict[str, Any], Any]] = []
+    nsfw = False
+
+    remaining = albums if fill else albums[:amount]
+    while remaining and len(covers) < amount:
+        needed = amount - len(covers)
+        batch, remaining = remaining[:needed], remaining[needed:]
+
+        results = await asyncio.gather(
+            *[_fetch_cover(bot, album, size, decode, semaphore) for album in batch],
+            return_exceptions=True,
+        )
+        for album, result in zip(batch, results):
+            if isinstance(result, (IndexError, NoCover)):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+
+            cover, cover_nsfw = result
+            covers.append((album, cover))
+            nsfw = nsfw or cover_nsfw
+
+    return covers, nsfw
+
+
+def format_timings(timings: Dict[str, float]) -> str:
+    stages = " · ".join(
+        f"{name} {time * 1000:,.0f}ms" for name, time in timings.items()
+    )
+    return f"-# {stages}"
+
+
+@to_thread
+def make_chart(data: List[Tuple[Any, str]], name: str):
     # fmt: off
     image_cords = itertools.chain(
         [(100, 100), (400, 100), (700, 100), (100, 400), (400, 400), (700, 400), (100, 700), (400, 700), (700, 700),]
@@ -30,14 +112,13 @@ def make_chart(data: List[Tuple[BytesIO, str]], name: str):
         text_x = 500 - text_width // 2
         draw.text((text_x, 30), name, fill=(255, 255, 255), font=name_font)
 
-        for item in data:
-            with Image.open(item[0]) as cover:
+        for cover, text in data:
+            x, y = next(image_cords)
+            # covers from the thumbnail cache are smaller when the source was
+            if cover.size != (200, 200):
                 cover = cover.resize((200, 200))
-                x, y = next(image_cords)
-                image.paste(cover, (x, y))
-                draw.text(
-                    (x, y + 200 + spacing), item[1], font=font, fill=(255, 255, 255)
-                )
+            image.paste(cover, (x, y))
+            draw.text((x, y + 200 + spacing), text, font=font, fill=(255, 255, 255))
 
         image.save(output_buffer, "png")
         output_buffer.seek(0)
@@ -69,7 +150,7 @@ async def get_top_albums(bot: Bot, period: str, name: str) -> Dict[Any, Any]:
 
 
 @to_thread
-def make_advanced_chart(data: List[Tuple[BytesIO, str]]):
+def make_advanced_chart(data: List[Tuple[Any, str]]):
 
     image_cords = itertools.chain(
         [
@@ -141,11 +222,11 @@ def make_advanced_chart(data: List[Tuple[BytesIO, str]]):
         new_im = Image.new("RGBA", (output.width, output.height))
         new_im.paste(output)
 
-        for item in data:
-            with Image.open(item[0]) as cover:
-                pos, size = next(image_cords)
+        for cover, _ in data:
+            pos, size = next(image_cords)
+            if cover.size != size:
                 cover = cover.resize(size)
-                new_im.paste(cover, pos)
+            new_im.paste(cover, pos)
 
         new_im.save(output_buffer, "png")
         output_buffer.seek(0)
@@ -2,7 +2,7 @@ from __future__ import annotations
 import textwrap
 
 from time import perf_counter
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 import discord
 import psutil
@@ -17,6 +17,22 @@ if TYPE_CHECKING:
 
 
 class About(CogBase):
+    async def log_counts(self, *names: str) -> Dict[str, Tuple[int, int]]:
+        """Returns the total and today's row count for each logging table."""
+        today = discord.utils.utcnow().date()
+
+        sql = """
+        SELECT name, SUM(count)::BIGINT AS total, COALESCE(SUM(count) FILTER (WHERE day = $2), 0)::BIGINT AS today
+        FROM log_counters WHERE name = ANY($1::TEXT[])
+        GROUP BY name
+        """
+        records = await self.bot.pool.fetch(sql, list(names), today)
+        counts = {
+            record["name"]: (record["total"], record["today"]) for record in records
+        }
+
+        return {name: counts.get(name, (0, 0)) for name in names}
+
     @commands.command(name="invite", aliases=("join",))
     async def invite(self, ctx: commands.Context):
         """Sends an invite link to the bot"""
@@ -30,16 +46,8 @@ class About(CogBase):
         if ctx.bot.user is None:
             return
 
-        sql = """SELECT * FROM command_logs"""
-        results = await self.bot.pool.fetch(sql)
-
-        total = len(results)
-        start = discord.utils.utcnow().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        total_today = len(
-            [result for result in results if result["created_at"] >= start]
-        )
+        counts = await self.log_counts("command_logs")
+        total, total_today = counts["command_logs"]
         memory_usage = self.process.memory_full_info().uss / 1024**2
         cpu_usage = self.process.cpu_percent() / psutil.cpu_count()
         cr = await get_or_fetch_user(bot=self.bot, user_id=766953372309127168)
@@ -96,22 +104,12 @@ class About(CogBase):
         async with ctx.typing():
             # fmt: off
             members_count: int = sum(g.member_count for g in bot.guilds)  # type: ignore
-            start = discord.utils.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-
-            avatars = await bot.pool.fetch("SELECT created_at FROM avatars")
-            avatars_today = len([result for result in avatars if result["created_at"] >= start])
-
-            commands = await bot.pool.fetch("SELECT created_at FROM command_logs")
-            commands_today = len([result for result in commands if result["created_at"] >= start])
-
-            usernames = await bot.pool.fetch("SELECT created_at FROM username_logs")
-            usernames_today = len([result for result in usernames if result["created_at"] >= start])
-
-            nicknames = await bot.pool.fetch("SELECT created_at FROM nickname_logs")
-            nicknames_today = len([result for result in nicknames if result["created_at"] >= start])
-
-            discrims = await bot.pool.fetch("SELECT created_at FROM discrim_logs")
-            discrims_today = len([result for result in discrims if result["created_at"] >= start])
+            counts = await self.log_counts("avatars", "command_logs", "username_logs", "nickname_logs", "discrim_logs")
+            avatars, avatars_today = counts["avatars"]
+            commands, commands_today = counts["command_logs"]
+            usernames, usernames_today = counts["username_logs"]
+            nicknames, nicknames_today = counts["nickname_logs"]
+            discrims, discrims_today = counts["discrim_logs"]
             # fmt: on
             psql_start = perf_counter()
             await bot.pool.execute("SELECT 1")
@@ -145,11 +143,11 @@ class About(CogBase):
              websocket latency : {round(bot.latency * 1000, 3)}ms
             postgresql latency : {round(psql_end - psql_start, 3)}ms
                  redis latency : {round(redis_end - redis_start, 3)}ms
-                avatars logged : {len(avatars):,} - {avatars_today:,}
-              usernames logged : {len(usernames):,} - {usernames_today:,}
-               discrims logged : {len(discrims):,} - {discrims_today:,}
-              nicknames logged : {len(nicknames):,} - {nicknames_today:,}
-                  commands ran : {len(commands):,} - {commands_today:,}
+                avatars logged : {avatars:,} - {avatars_today:,}
+              usernames logged : {usernames:,} - {usernames_today:,}
+               discrims logged : {discrims:,} - {discrims_today:,}
+              nicknames logged : {nicknames:,} - {nicknames_today:,}
+                  commands ran : {commands:,} - {commands_today:,}
                   """
 
         await ctx.send(f"```yaml{textwrap.dedent(message)}```")
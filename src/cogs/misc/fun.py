@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import difflib
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict
 
 import discord
 from discord.ext import commands
 
-from utils import human_join, to_bytesio, RPSView, WTPView
+from utils import human_join, response_checker, to_bytesio, RPSView, WTPView
 
 from ._base import CogBase
 
@@ -20,26 +20,40 @@ class Fun(CogBase):
     async def character(self, ctx: Context, *, character: str):
         """Gets the information about a genshin character."""
 
+        # the cache key is case insensitive, so the url has to be as well
+        character = character.strip().lower()
         pattern = re.compile(r'"(?P<name>[a-zA-Z-]{1,})"')
-        async with self.bot.session.get("https://api.genshin.dev/characters") as r:
-            results = await r.text()
 
+        async def fetch_characters() -> str:
+            async with self.bot.web.get("https://api.genshin.dev/characters") as r:
+                response_checker(r)
+                return await r.text()
+
+        results = await self.bot.responses.fetch(
+            "genshin.characters", {}, fetch_characters
+        )
         characters = pattern.findall(results)
 
-        if not character.lower() in [c for c in characters]:
+        if not character in [c for c in characters]:
 
             message = "Character not found.\n\n"
-            maybe = difflib.get_close_matches(character.lower(), characters)
+            maybe = difflib.get_close_matches(character, characters)
             if maybe:
                 message += f"Did you mean `{human_join(maybe)}`?"
 
             await ctx.send(message)
             return
 
-        async with self.bot.session.get(
-            f"https://api.genshin.dev/characters/{character}"
-        ) as r:
-            results = await r.json()
+        async def fetch_character() -> Dict[str, Any]:
+            async with self.bot.web.get(
+                f"https://api.genshin.dev/characters/{character}"
+            ) as r:
+                response_checker(r)
+                return await r.json()
+
+        results = await self.bot.responses.fetch(
+            "genshin.character", {"name": character}, fetch_character
+        )
 
         embed = discord.Embed(
             color=ctx.bot.embedcolor, description=results["description"]
@@ -138,7 +138,7 @@ class Steam(CogBase):
             "appids": app_id,
         }
 
-        async with ctx.session.get(url, params=params) as response:
+        async with self.bot.web.get(url, params=params) as response:
             response_checker(response)
             json = await response.json()
             if not json[str(app_id)]["success"]:
@@ -20,13 +20,16 @@ from utils import (
     BlankException,
     CoverView,
     ExtensionConverter,
+    LazyModule,
     NoCover,
     SimplePages,
     UntilFlag,
     cleanup_code,
+    flights,
     plural,
     response_checker,
-    setup_pokemon,
+    refresh_pokemon,
+    thumbnails,
     to_bytesio,
 )
 
@@ -73,9 +76,9 @@ class Owner(
 
     @commands.command(name="update_pokemon", extras={"UPerms": ["Bot Owner"]})
     async def update_pokemon(self, ctx: Context):
-        await setup_pokemon(self.bot)
+        updated = await refresh_pokemon(self.bot)
 
-        await ctx.send("updated olk")
+        await ctx.send("updated olk" if updated else "already up to date")
 
     @commands.command(name="load", aliases=("reload",))
     async def load(self, ctx: Context, *extensions: ExtensionConverter):
@@ -259,12 +262,12 @@ class Owner(
             await self.bot.pool.execute(
                 sql, snowflake.id, reason, discord.utils.utcnow()
             )
-            await self.bot.redis.sadd("block_list", snowflake.id)
+            await self.bot.mirror.add("block_list", snowflake.id)
             msg = f"{snowflake.id} has been blocked"
         except asyncpg.UniqueViolationError:
             sql = """DELETE FROM block_list WHERE snowflake = $1"""
             await self.bot.pool.execute(sql, snowflake.id)
-            await self.bot.redis.srem("block_list", snowflake.id)
+            await self.bot.mirror.remove("block_list", snowflake.id)
             msg = f"{snowflake.id} has been unblocked"
 
         await ctx.send(msg)
@@ -284,6 +287,89 @@ class Owner(
         pages.embed.title = "Servers"
         await pages.start(ctx)
 
+    @dev.command(name="messages")
+    async def dev_messages(self, ctx: Context):
+        """Shows where incoming messages were routed"""
+        stats = self.bot.router.stats
+        data = [f"{name} | {count:,}" for name, count in stats.most_common()]
+        pages = SimplePages(entries=data or ["Nothing routed yet."], per_page=10, ctx=ctx)
+        pages.embed.title = "Message routing"
+        await pages.start(ctx)
+
+    @dev.command(name="logs")
+    async def dev_logs(self, ctx: Context):
+        """Shows the state of the log write buffer"""
+        logs = self.bot.logs
+        data = [f"pending | {logs.depth:,}", f"last flush | {logs.last_flush * 1000:.2f}ms"]
+        data.extend(f"{name} | {count:,}" for name, count in logs.stats.most_common())
+        pages = SimplePages(entries=data, per_page=10, ctx=ctx)
+        pages.embed.title = "Log writer"
+        await pages.start(ctx)
+
+    @dev.command(name="presences")
+    async def dev_presences(self, ctx: Context):
+        """Shows the state of the presence write buffer"""
+        presences = self.bot.presences
+        data = [f"last flush | {presences.last_flush * 1000:.2f}ms"]
+        data.extend(f"{name} | {count:,}" for name, count in presences.stats.most_common())
+        pages = SimplePages(entries=data, per_page=10, ctx=ctx)
+        pages.embed.title = "Presence writer"
+        await pages.start(ctx)
+
+    @dev.command(name="startup")
+    async def dev_startup(self, ctx: Context):
+        """Shows how long each extension took to load"""
+        timings = sorted(
+            self.bot.extension_timings.items(), key=lambda t: t[1][1], reverse=True
+        )
+        data = [
+            f"{name} | {total * 1000:,.2f}ms | import {imported * 1000:,.2f}ms"
+            for name, (imported, total) in timings
+        ]
+        pages = SimplePages(entries=data or ["No extensions loaded."], per_page=10, ctx=ctx)
+        pages.embed.title = "Extension load times"
+        await pages.start(ctx)
+
+    @dev.command(name="imports")
+    async def dev_imports(self, ctx: Context):
+        """Shows which lazily imported modules are loaded and how long they took"""
+        data = [
+            f"{module.name} | {module.import_time * 1000:,.2f}ms"
+            if module.import_time is not None
+            else f"{module.name} | not loaded"
+            for module in LazyModule.modules
+        ]
+        pages = SimplePages(entries=data, per_page=10, ctx=ctx)
+        pages.embed.title = "Lazy imports"
+        await pages.start(ctx)
+
+    @dev.command(name="http")
+    async def dev_http(self, ctx: Context):
+        """Shows requests, retries and latency per upstream"""
+        web = self.bot.web
+        data = []
+        for name, stats in sorted(web.stats.items(), key=lambda s: s[1]["requests"], reverse=True):
+            average = web.latency[name] / stats["requests"] * 1000 if stats["requests"] else 0
+            counts = ", ".join(f"{key} {count:,}" for key, count in stats.most_common() if key != "requests")
+            data.append(f"{name} | {stats['requests']:,} requests | avg {average:,.2f}ms\n{counts}")
+        data.append(f"coalesced | {flights.stats['shared']:,} of {flights.stats['calls'] + flights.stats['shared']:,} calls")
+        pages = SimplePages(entries=data, per_page=10, ctx=ctx)
+        pages.embed.title = "Upstream requests"
+        await pages.start(ctx)
+
+    @dev.command(name="cache")
+    async def dev_cache(self, ctx: Context):
+        """Shows hits and misses of the response cache per endpoint"""
+        stats = sorted(self.bot.responses.stats.items(), key=lambda s: sum(s[1].values()), reverse=True)
+        data = [
+            f"{endpoint} | " + ", ".join(f"{key} {count:,}" for key, count in counts.most_common())
+            for endpoint, counts in stats
+        ]
+        data.append("thumbnails | " + ", ".join(f"{key} {count:,}" for key, count in thumbnails.stats.most_common()))
+        pages = SimplePages(entries=data, per_page=10, ctx=ctx)
+        pages.embed.title = "Response cache"
+        await pages.start(ctx)
+
     @dev.command(name="cover")
     async def dev_cover(self, ctx: Context, *, query: str):
         url = "https://api.spotify.com/v1/search"
@@ -295,7 +381,7 @@ class Owner(
 
         data = {"q": query, "type": "album", "market": "ES", "limit": "1"}
 
-        async with self.bot.session.get(url, headers=headers, params=data) as r:
+        async with self.bot.web.get(url, headers=headers, params=data) as r:
             response_checker(r)
             results: Dict = await r.json()
 
@@ -309,8 +395,9 @@ class Owner(
             file=discord.File(
                 await to_bytesio(ctx.session, image_url),
                 "cover.png",
-                spoiler=results["albums"]["items"][0]["id"]
-                in await self.bot.redis.smembers("nsfw_covers"),
+                spoiler=self.bot.mirror.contains(
+                    "nsfw_covers", results["albums"]["items"][0]["id"]
+                ),
             ),
         )
 
@@ -28,7 +28,7 @@ class OptCog(CogBase):
         """Opt in or out of a logger
 
         Due to technical reasons, opting out from `guild names`, `guild bans` and `guild icons` is not possible yet, but you can still delete the data at any time."""
-        items: Set[str] = await ctx.redis.smembers(f"opted_out:{ctx.author.id}")
+        items: Set[str] = ctx.bot.mirror.members(f"opted_out:{ctx.author.id}")
 
         if items == set():
             raise BlankException(
@@ -49,7 +49,7 @@ class OptCog(CogBase):
         sql = """UPDATE opted_out SET items = array_remove(opted_out.items, $1) WHERE user_id = $2"""
 
         await ctx.pool.execute(sql, logger, ctx.author.id)
-        await ctx.redis.srem(f"opted_out:{ctx.author.id}", logger)
+        await ctx.bot.mirror.remove(f"opted_out:{ctx.author.id}", logger)
         await ctx.send(str(CHECK))
 
     @opt_group.command(name="out")
@@ -67,5 +67,5 @@ class OptCog(CogBase):
         """
 
         await ctx.pool.execute(sql, ctx.author.id, logger)
-        await ctx.redis.sadd(f"opted_out:{ctx.author.id}", logger)
+        await ctx.bot.mirror.add(f"opted_out:{ctx.author.id}", logger)
         await ctx.send(str(CHECK))
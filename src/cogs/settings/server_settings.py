@@ -10,6 +10,7 @@ from utils import (
     FieldPageSource,
     Pager,
     add_prefix,
+    remove_prefix,
     get_or_fetch_user,
     BlankException,
     DoNothing,
@@ -45,9 +46,9 @@ class ServerSettings(CogBase):
         value: bool = results["fm_autoreact"]
 
         if value:
-            await self.bot.redis.sadd("fm_autoreactions", ctx.author.id)
+            await self.bot.mirror.add("fm_autoreactions", ctx.author.id)
         else:
-            await self.bot.redis.srem("fm_autoreactions", ctx.author.id)
+            await self.bot.mirror.remove("fm_autoreactions", ctx.author.id)
 
         await ctx.send(
             f"{'Enabled' if value else 'Disabled'} auto-reactions on the fm command for you."
@@ -78,9 +79,9 @@ class ServerSettings(CogBase):
         value: bool = results["auto_reactions"]
 
         if value:
-            await self.bot.redis.sadd("auto_reactions", ctx.guild.id)
+            await self.bot.mirror.add("auto_reactions", ctx.guild.id)
         else:
-            await self.bot.redis.srem("auto_reactions", ctx.guild.id)
+            await self.bot.mirror.remove("auto_reactions", ctx.guild.id)
 
         await ctx.send(
             f"{'Enabled' if value else 'Disabled'} auto-reactions in this server."
@@ -99,17 +100,17 @@ class ServerSettings(CogBase):
             sql = "INSERT INTO guild_settings(guild_id, poketwo) VALUES($1, $2)"
             await self.bot.pool.execute(sql, ctx.guild.id, True)
         except asyncpg.UniqueViolationError:
-            if str(ctx.guild.id) in await self.bot.redis.smembers("poketwo_guilds"):
+            if self.bot.mirror.contains("poketwo_guilds", ctx.guild.id):
                 sql = "UPDATE guild_settings SET poketwo = NULL WHERE guild_id = $1"
                 await self.bot.pool.execute(sql, ctx.guild.id)
-                await self.bot.redis.srem("poketwo_guilds", ctx.guild.id)
+                await self.bot.mirror.remove("poketwo_guilds", ctx.guild.id)
                 await ctx.send("Disabled auto solving for this server.")
                 return
 
             sql = "UPDATE guild_settings SET poketwo = $1 WHERE guild_id = $2"
             await self.bot.pool.execute(sql, True, ctx.guild.id)
 
-        await self.bot.redis.sadd("poketwo_guilds", ctx.guild.id)
+        await self.bot.mirror.add("poketwo_guilds", ctx.guild.id)
         await ctx.send("Enabled auto solving for this server.")
 
     @commands.group(name="prefix", invoke_without_command=True)
@@ -167,7 +168,7 @@ class ServerSettings(CogBase):
         try:
             sql = """DELETE FROM guild_prefixes WHERE guild_id = $1 AND prefix = $2"""
             await ctx.bot.pool.execute(sql, ctx.guild.id, prefix)
-            self.bot.prefixes[ctx.guild.id].remove(prefix)
+            remove_prefix(self.bot, ctx.guild.id, prefix)
             await ctx.send(f"Removed prefix `{prefix}` from the server.")
         except (KeyError, ValueError):
             await ctx.send("This prefix does not exist.")
@@ -205,9 +206,7 @@ class ServerSettings(CogBase):
     )
     @commands.has_guild_permissions(manage_guild=True)
     async def auto_download_set(self, ctx: Context, channel: discord.TextChannel):
-        adl_channels = await self.bot.redis.smembers("auto_download_channels")
-
-        if str(channel.id) in adl_channels:
+        if self.bot.mirror.contains("auto_download_channels", channel.id):
             return await ctx.send(f"Auto-download is already setup here.")
 
         if not channel.permissions_for(ctx.me).send_messages:
@@ -224,7 +223,7 @@ class ServerSettings(CogBase):
         """
 
         await self.bot.pool.execute(sql, ctx.guild.id, channel.id)
-        await self.bot.redis.sadd("auto_download_channels", channel.id)
+        await self.bot.mirror.add("auto_download_channels", channel.id)
         await ctx.send(f"Auto-download is now set to {channel.mention}.")
 
     @auto_download.command(
@@ -250,5 +249,5 @@ class ServerSettings(CogBase):
 
         sql = """UPDATE guild_settings SET auto_download = NULL WHERE guild_id = $1"""
         await self.bot.pool.execute(sql, ctx.guild.id)
-        await self.bot.redis.srem("auto_download_channels", str(result))
+        await self.bot.mirror.remove("auto_download_channels", result)
         await ctx.send(f"Removed auto-downloads for this server.")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import base64
+import datetime
 import os
 import re
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+import asyncpg
+import discord
 from discord.ext import commands, tasks
 
 if TYPE_CHECKING:
@@ -12,6 +15,30 @@ if TYPE_CHECKING:
 
 from utils import DevError
 
+# partitioned log tables and the column they're partitioned by
+PARTITIONED_LOGS: Dict[str, str] = {
+    "command_logs": "created_at",
+    "member_join_logs": "time",
+    "nickname_logs": "created_at",
+    "username_logs": "created_at",
+    "tatsu_rep_logs": "created_at",
+    "guild_join_logs": "time",
+    "presence_sessions": "started_at",
+}
+
+# logs that may be compacted, with the query that rolls up rows older than $1
+# None means the rows are already aggregated as they're written
+LOG_ROLLUPS: Dict[str, Optional[str]] = {
+    "command_logs": """
+        INSERT INTO command_daily (day, command, count)
+        SELECT (created_at AT TIME ZONE 'UTC')::DATE, command, COUNT(*)
+        FROM command_logs WHERE created_at < $1
+        GROUP BY 1, 2
+        ON CONFLICT (day, command) DO UPDATE SET count = command_daily.count + EXCLUDED.count
+    """,
+    "presence_sessions": None,
+}
+
 
 async def setup(bot: Bot):
     await bot.add_cog(Tasks(bot))
@@ -23,9 +50,11 @@ class Tasks(commands.Cog, name="tasks"):
 
     async def cog_unload(self):
         self.set_key_task.cancel()
+        self.log_maintenance.cancel()
 
     async def cog_load(self) -> None:
         self.set_key_task.start()
+        self.log_maintenance.start()
 
     async def set_spotify_key(self):
         url = "https://accounts.spotify.com/api/token"
@@ -70,3 +99,69 @@ class Tasks(commands.Cog, name="tasks"):
             if file.endswith(valid_formats):
                 if re.sub("(ytdl|part)", "", file) not in self.bot.current_downloads:
                     os.remove(f"src/files/videos/{file}")
+
+    async def compact_logs(self, conn: asyncpg.Connection, table: str, days: int):
+        """Rolls up and removes the rows of ``table`` older than ``days``.
+
+        The cutoff is rounded down to the start of a month so whole partitions
+        can be dropped instead of deleting row by row. Only the legacy
+        partition, which starts at ``MINVALUE``, can reach past the cutoff
+        and has its old rows deleted until it's old enough to drop too.
+        """
+        column = PARTITIONED_LOGS[table]
+        rollup = LOG_ROLLUPS[table]
+
+        oldest = discord.utils.utcnow() - datetime.timedelta(days=days)
+        cutoff = oldest.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+        sql = r"""
+        SELECT c.relname,
+               substring(pg_get_expr(c.relpartbound, c.oid) FROM 'FROM \(''([^'']+)''\)')::TIMESTAMPTZ AS lower,
+               substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([^'']+)''\)')::TIMESTAMPTZ AS upper
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = $1::TEXT::regclass
+        """
+
+        async with conn.transaction():
+            # keeps log_counters from forgetting the rows we remove
+            await conn.execute("SET LOCAL fish.retention = 'on'")
+
+            if rollup is not None:
+                await conn.execute(rollup, cutoff)
+
+            dropped = deleted = 0
+            for record in await conn.fetch(sql, table):
+                name, lower, upper = record["relname"], record["lower"], record["upper"]
+
+                if upper is not None and upper <= cutoff:
+                    await conn.execute(f'DROP TABLE "{name}"')
+                    dropped += 1
+                elif lower is None or lower < cutoff:
+                    status = await conn.execute(
+                        f'DELETE FROM "{name}" WHERE {column} < $1', cutoff
+                    )
+                    deleted += int(status.split()[-1])
+
+        self.bot.logger.info(
+            f"Compacted {table} up to {cutoff:%Y-%m}: dropped {dropped} partitions, deleted {deleted} rows"
+        )
+
+    @tasks.loop(hours=24.0)
+    async def log_maintenance(self):
+        retention: Dict[str, int] = self.bot.config.get("logs", {}).get("retention", {})
+
+        async with self.bot.pool.acquire() as conn:
+            for table in PARTITIONED_LOGS:
+                await conn.execute("SELECT ensure_log_partitions($1)", table)
+
+            for table, days in retention.items():
+                if table not in LOG_ROLLUPS:
+                    self.bot.logger.warning(f"Retention is not supported for {table}")
+                    continue
+
+                await self.compact_logs(conn, table, days)
+
+    @log_maintenance.before_loop
+    async def before_log_maintenance(self):
+        await self.bot.wait_until_ready()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import asyncio
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
 import discord
 
@@ -17,7 +16,6 @@ from .tags import TagCommands
 
 if TYPE_CHECKING:
     from bot import Bot
-    from utils import PGTimer
 
 
 class Tools(
@@ -34,12 +32,6 @@ class Tools(
 ):
     """Useful tools"""
 
-    def __init__(self, bot: Bot):
-        super().__init__(bot)
-        self._have_data = asyncio.Event()
-        self._current_timer: Optional[PGTimer] = None
-        self._task = bot.loop.create_task(self.dispatch_timers())
-
     @property
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="\U0001f528")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Union
 
 import discord
 from discord.ext import commands
@@ -22,7 +22,7 @@ class AfkCommands(CogBase):
     @commands.command(name="afk")
     async def afk(self, ctx: Context, reason: str = "No reason set."):
         """Enables afk messages"""
-        if str(ctx.author.id) in await self.bot.redis.smembers("afk_users"):
+        if self.bot.mirror.contains("afk_users", ctx.author.id):
             return
 
         sql = """
@@ -31,23 +31,15 @@ class AfkCommands(CogBase):
         """
 
         await self.bot.pool.execute(sql, ctx.author.id, reason, discord.utils.utcnow())
-        await self.bot.redis.sadd("afk_users", ctx.author.id)
+        await self.bot.mirror.add("afk_users", ctx.author.id)
         await ctx.send(f"Alright {ctx.author.mention}, see you soon.")
 
-    @commands.Cog.listener("on_message")
-    async def afk_check(self, message: discord.Message):
-        if message.guild is None:
-            return
-        afk_users = await self.bot.redis.smembers("afk_users")
-
-        if str(message.author.id) in afk_users:
-            return
-
-        mentions = [user for user in message.mentions if str(user.id) in afk_users]
-
-        if mentions == []:
-            return
-
+    @commands.Cog.listener("on_afk_mention")
+    async def afk_check(
+        self,
+        message: discord.Message,
+        mentions: List[Union[discord.User, discord.Member]],
+    ):
         to_send = []
 
         for user in mentions:
@@ -64,14 +56,9 @@ class AfkCommands(CogBase):
             to_send = f"{'Those users are' if len(mentions) > 1 else 'That user is'} currently AFK, they'll be back later."
             await message.channel.send(to_send)
 
-    @commands.Cog.listener("on_message")
+    @commands.Cog.listener("on_afk_return")
     async def afk_return(self, message: discord.Message):
-        if message.guild is None:
-            return
-        afk_users = await self.bot.redis.smembers("afk_users")
-
-        if str(message.author.id) in afk_users:
-            await message.add_reaction("\U0001f44b")
-            sql = """DELETE FROM afk WHERE user_id = $1"""
-            await self.bot.pool.execute(sql, message.author.id)
-            await self.bot.redis.srem("afk_users", message.author.id)
+        await message.add_reaction("\U0001f44b")
+        sql = """DELETE FROM afk WHERE user_id = $1"""
+        await self.bot.pool.execute(sql, message.author.id)
+        await self.bot.mirror.remove("afk_users", message.author.id)
@@ -27,20 +27,26 @@ class AnimeCommands(CogBase):
         )
 
         data = {"query": search_query, "variables": {"search": query}}
-        async with self.bot.session.post("https://graphql.anilist.co", json=data) as r:
-            response_checker(r)
-            results: Dict = await r.json()
-
-            if results.get("errors"):
-                raise ValueError(
-                    textwrap.dedent(
-                        f"""Unable to get info 
-                        Error: {results['errors']['message']}
-                        Status: {results['errors']['status']}
-                        Location: Line `{results['errors']['locations']['line']}`, Column `{results['errors']['locations']['column']}`"""
+
+        async def fetch() -> Dict[Any, Any]:
+            async with self.bot.web.post("https://graphql.anilist.co", json=data) as r:
+                response_checker(r)
+                results: Dict = await r.json()
+
+                if results.get("errors"):
+                    raise ValueError(
+                        textwrap.dedent(
+                            f"""Unable to get info 
+                            Error: {results['errors']['message']}
+                            Status: {results['errors']['status']}
+                            Location: Line `{results['errors']['locations']['line']}`, Column `{results['errors']['locations']['column']}`"""
+                        )
                     )
-                )
-            return results["data"]["Media"]
+                return results["data"]["Media"]
+
+        return await self.bot.responses.fetch(
+            f"anilist.{mode}", {"search": query}, fetch
+        )
 
     def cleanup_html(self, text: str) -> str:
         text = re.sub("<br>", "\n", text)
@@ -41,7 +41,7 @@ class GoogleCommands(CogBase):
             "key": self.bot.config["keys"]["google-search"],
         }
         await ctx.trigger_typing()
-        async with self.bot.session.get(url, params=params) as r:
+        async with self.bot.web.get(url, params=params) as r:
             response_checker(r)
             data = await r.json()
 
@@ -86,7 +86,7 @@ class GoogleCommands(CogBase):
         }
 
         await ctx.trigger_typing()
-        async with self.bot.session.get(url, params=params) as r:
+        async with self.bot.web.get(url, params=params) as r:
             response_checker(r)
             results = await r.json()
 
@@ -125,7 +125,7 @@ class GoogleCommands(CogBase):
         }
 
         await ctx.trigger_typing()
-        async with self.bot.session.get(url, params=params) as r:
+        async with self.bot.web.get(url, params=params) as r:
             response_checker(r)
             data = await r.json()
             try:
@@ -11,19 +11,20 @@ from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional
 import discord
 from bs4 import BeautifulSoup
 from discord.ext import commands
-from playwright.async_api import async_playwright
 
 from utils import (
     Pager,
     TenorUrlConverter,
     UrbanPageSource,
     emoji_extras,
+    playwright,
     human_join,
     to_thread,
     BlankException,
     get_size,
     get_wh,
     get_pokemon,
+    response_checker,
 )
 
 from ._base import CogBase
@@ -130,8 +131,8 @@ class OtherCommands(CogBase):
 
         async with ctx.typing():
             start = time.perf_counter()
-            async with async_playwright() as playwright:
-                browser = await playwright.chromium.launch()
+            async with playwright.async_playwright() as pw:
+                browser = await pw.chromium.launch()
                 page = await browser.new_page()
                 await page.goto(url)
                 await asyncio.sleep(delay)
@@ -241,11 +242,17 @@ class OtherCommands(CogBase):
 
         url = "https://api.urbandictionary.com/v0/define"
 
-        async with ctx.session.get(url, params={"term": word}) as resp:
-            json = await resp.json()
-            data: List[Dict[Any, Any]] = json.get("list", [])
-            if not data:
-                return await ctx.send("Nothing was found for this phrase.")
+        async def fetch() -> List[Dict[Any, Any]]:
+            async with self.bot.web.get(url, params={"term": word}) as resp:
+                response_checker(resp)
+                json = await resp.json()
+                return json.get("list", [])
+
+        data: List[Dict[Any, Any]] = await self.bot.responses.fetch(
+            "urban", {"term": word}, fetch
+        )
+        if not data:
+            return await ctx.send("Nothing was found for this phrase.")
 
         p = UrbanPageSource(data, per_page=4)
         menu = Pager(p, ctx=ctx)
@@ -41,6 +41,7 @@ class ReminderCommands(CogBase):
             ctx.channel.id,
             when.arg,
             created=ctx.message.created_at,
+            owner_id=ctx.author.id,
             message_id=ctx.message.id,
         )
         delta = timer_module.human_timedelta(when.dt, source=timer.created_at)
@@ -52,11 +53,11 @@ class ReminderCommands(CogBase):
         query = """SELECT id, expires, extra #>> '{args,2}'
                    FROM reminders
                    WHERE event = 'reminder'
-                   AND extra #>> '{args,0}' = $1
+                   AND owner_id = $1
                    ORDER BY expires;
                 """
 
-        records = await ctx.db.fetch(query, str(ctx.author.id))
+        records = await ctx.db.fetch(query, ctx.author.id)
 
         if len(records) == 0:
             return await ctx.send("No reminders.")
@@ -86,18 +87,16 @@ class ReminderCommands(CogBase):
         query = """DELETE FROM reminders
                    WHERE id=$1
                    AND event = 'reminder'
-                   AND extra #>> '{args,0}' = $2;
+                   AND owner_id = $2
+                   RETURNING id;
                 """
 
-        status = await ctx.db.execute(query, id, str(ctx.author.id))
-        if status == "DELETE 0":
+        records = await ctx.db.fetch(query, id, ctx.author.id)
+        if not records:
             return await ctx.send("Could not delete any reminders with that ID.")
 
-        # if the current timer is being deleted
-        if self._current_timer and self._current_timer.id == id:
-            # cancel the task and re-run it
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+        # make sure the timer isn't still sitting in memory
+        self.bot.timers.discard([record["id"] for record in records])
 
         await ctx.send("Successfully deleted reminder.")
 
@@ -110,10 +109,10 @@ class ReminderCommands(CogBase):
         query = """SELECT COUNT(*)
                    FROM reminders
                    WHERE event = 'reminder'
-                   AND extra #>> '{args,0}' = $1;
+                   AND owner_id = $1;
                 """
 
-        author_id = str(ctx.author.id)
+        author_id = ctx.author.id
         total: asyncpg.Record = await ctx.db.fetchrow(query, author_id)
         total = total[0]
         if total == 0:
@@ -125,13 +124,11 @@ class ReminderCommands(CogBase):
         if not confirm:
             return await ctx.send("Aborting", ephemeral=True)
 
-        query = """DELETE FROM reminders WHERE event = 'reminder' AND extra #>> '{args,0}' = $1;"""
-        await ctx.db.execute(query, author_id)
+        query = """DELETE FROM reminders WHERE event = 'reminder' AND owner_id = $1 RETURNING id;"""
+        records = await ctx.db.fetch(query, author_id)
 
-        # Check if the current timer is the one being cleared and cancel it if so
-        if self._current_timer and self._current_timer.author_id == ctx.author.id:
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+        # make sure none of the cleared timers are still sitting in memory
+        self.bot.timers.discard([record["id"] for record in records])
 
         await ctx.send(f"Successfully deleted {plural(total):reminder}.")
 
@@ -168,11 +165,11 @@ class ReminderCommands(CogBase):
         query = """SELECT id, expires, extra #>> '{args,2}'
                    FROM reminders
                    WHERE event = 'reminder'
-                   AND extra #>> '{args,0}' = $1
+                   AND owner_id = $1
                    ORDER BY expires;
                 """
 
-        records = await ctx.db.fetch(query, str(ctx.author.id))
+        records = await ctx.db.fetch(query, ctx.author.id)
 
         if len(records) == 0:
             return await ctx.send("No reminders.")
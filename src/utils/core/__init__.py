@@ -1 +1,9 @@
 from .startup import *
+from .timers import *
+from .mirror import *
+from .messages import *
+from .logs import *
+from .presence import *
+from .migrations import *
+from .http import *
+from .cache import *
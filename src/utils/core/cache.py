@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import aioredis
+
+if TYPE_CHECKING:
+    from bot import Bot
+
+
+class ResponseCache:
+    """Keeps upstream API responses in redis for a while.
+
+    Helpers pass their request through :meth:`fetch` with an endpoint name
+    and the parameters that make the response what it is. Endpoints listed
+    in :attr:`ttls` are cached, anything else goes straight to the upstream,
+    so a helper can always go through here and the table decides.
+
+    An entry is fresh for the first number of seconds and served as is,
+    then stale for the second number: still served, but a refresh starts in
+    the background so the next caller gets a new one. After that it's gone.
+    """
+
+    prefix: str = "responses:"
+    # endpoint -> (fresh, stale) in seconds
+    ttls: Dict[str, Tuple[float, float]] = {
+        "lastfm.user.gettoptracks": (300.0, 3600.0),
+        "lastfm.user.gettopartists": (300.0, 3600.0),
+        "lastfm.user.gettopalbums": (300.0, 3600.0),
+        "steam.ISteamUser/GetPlayerSummaries": (300.0, 3600.0),
+        "steam.IPlayerService/GetOwnedGames": (600.0, 3600.0),
+        "steam.ISteamUser/GetFriendList": (600.0, 3600.0),
+        "anilist.anime": (3600.0, 86400.0),
+        "anilist.manga": (3600.0, 86400.0),
+        "urban": (3600.0, 86400.0),
+        "genshin.characters": (86400.0, 86400.0 * 7),
+        "genshin.character": (86400.0, 86400.0 * 7),
+    }
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self._refreshing: Set[str] = set()
+
+        # endpoint -> hits, stale, misses, refreshes, errors
+        self.stats: Dict[str, Counter[str]] = {}
+
+    def _record(self, endpoint: str, key: str) -> None:
+        self.stats.setdefault(endpoint, Counter())[key] += 1
+
+    def key(self, endpoint: str, params: Dict[str, Any]) -> str:
+        # so "Liz", "liz " and reordered params all land on the same entry
+        normalised = {
+            str(k): v.strip().casefold() if isinstance(v, str) else v
+            for k, v in params.items()
+        }
+        digest = hashlib.sha1(
+            json.dumps(normalised, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{self.prefix}{endpoint}:{digest}"
+
+    async def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            raw = await self.bot.redis.get(key)
+        except (aioredis.RedisError, OSError) as e:
+            self.bot.logger.warning(f"Failed to read cached response {key}: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        entry = json.loads(raw)
+        return entry["time"], entry["data"]
+
+    async def _write(self, key: str, data: Any, ttl: float) -> None:
+        entry = json.dumps({"time": time.time(), "data": data})
+        try:
+            await self.bot.redis.set(key, entry, ex=int(ttl))
+        except (aioredis.RedisError, OSError) as e:
+            self.bot.logger.warning(f"Failed to cache response {key}: {e}")
+
+    async def _refresh(
+        self,
+        endpoint: str,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> None:
+        try:
+            data = await fetch()
+        except Exception as e:
+            # the stale entry stays until it expires, the next caller tries again
+            self._record(endpoint, "errors")
+            self.bot.logger.warning(f"Failed to refresh {endpoint}: {e}")
+        else:
+            self._record(endpoint, "refreshes")
+            await self._write(key, data, ttl)
+        finally:
+            self._refreshing.discard(key)
+
+    async def fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Returns the cached response, or awaits ``fetch`` and caches it.
+
+        ``fetch`` must return something JSON serialisable. Errors it raises
+        are passed on and nothing is cached.
+        """
+        ttls = self.ttls.get(endpoint)
+        if ttls is None:
+            return await fetch()
+
+        fresh, stale = ttls
+        key = self.key(endpoint, params)
+        entry = await self._read(key)
+
+        if entry is not None:
+            cached_at, data = entry
+            if time.time() - cached_at < fresh:
+                self._record(endpoint, "hits")
+            else:
+                self._record(endpoint, "stale")
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self.bot.loop.create_task(
+                        self._refresh(endpoint, key, fresh + stale, fetch)
+                    )
+
+            return data
+
+        self._record(endpoint, "misses")
+        data = await fetch()
+        await self._write(key, data, fresh + stale)
+        return data
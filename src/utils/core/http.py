@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+from yarl import URL
+
+from ..vars import RateLimitExceeded
+
+if TYPE_CHECKING:
+    from bot import Bot
+
+
+@dataclass(frozen=True)
+class Upstream:
+    name: str
+    # token bucket, ``rate`` requests every ``per`` seconds
+    rate: int
+    per: float
+    # requests allowed in flight at once
+    connections: int = 10
+    retries: int = 2
+
+
+class TokenBucket:
+    def __init__(self, rate: int, per: float):
+        self.rate: int = rate
+        self.per: float = per
+        self._tokens: float = rate
+        self._updated: float = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.rate, self._tokens + (now - self._updated) * self.rate / self.per
+        )
+        self._updated = now
+
+    def take(self) -> float:
+        """Takes a token, returns how long to wait for one if there are none left."""
+        self._refill()
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        return (1 - self._tokens) * self.per / self.rate
+
+
+class WebClient:
+    """Every request to an outside API should go through here.
+
+    Each upstream gets a shared token bucket, so limits hold across
+    commands and users, and a cap on how many of its requests can be in
+    flight at once. Responses with a 429 or 5xx status are retried with
+    exponential backoff, honouring ``Retry-After`` when it's sent.
+
+    Hosts without an entry in :attr:`upstreams` still get a connection cap
+    and retries, just no rate limit.
+    """
+
+    upstreams: Dict[str, Upstream] = {
+        "ws.audioscrobbler.com": Upstream("lastfm", 5, 1.0, connections=10),
+        "api.steampowered.com": Upstream("steam", 200, 300.0),
+        "store.steampowered.com": Upstream("steam-store", 200, 300.0, connections=5),
+        "api.spotify.com": Upstream("spotify", 10, 1.0),
+        "api.dagpi.xyz": Upstream("dagpi", 60, 60.0, retries=0),
+        "graphql.anilist.co": Upstream("anilist", 90, 60.0, connections=5),
+        "customsearch.googleapis.com": Upstream("google", 10, 1.0, connections=5),
+        "www.googleapis.com": Upstream("google", 10, 1.0, connections=5),
+        "roblox.com": Upstream("roblox", 60, 60.0, connections=5),
+    }
+    default_connections: int = 10
+    default_retries: int = 2
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    max_backoff: float = 30.0
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        # upstream -> counters, see :meth:`_record`
+        self.stats: Dict[str, Counter[str]] = {}
+        # upstream -> total seconds spent waiting on responses
+        self.latency: Counter[str] = Counter()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.bot.session
+
+    def upstream(self, host: str) -> Optional[Upstream]:
+        # subdomains share their parent's entry, users.roblox.com -> roblox.com
+        parts = host.split(".")
+        for i in range(len(parts) - 1):
+            upstream = self.upstreams.get(".".join(parts[i:]))
+            if upstream is not None:
+                return upstream
+
+        return None
+
+    def _record(self, name: str, key: str, amount: int = 1) -> None:
+        self.stats.setdefault(name, Counter())[key] += amount
+
+    async def _acquire(self, upstream: Upstream, wait: bool) -> None:
+        bucket = self._buckets.get(upstream.name)
+        if bucket is None:
+            bucket = self._buckets[upstream.name] = TokenBucket(
+                upstream.rate, upstream.per
+            )
+
+        while retry_after := bucket.take():
+            if not wait:
+                self._record(upstream.name, "limited")
+                raise RateLimitExceeded()
+
+            self._record(upstream.name, "throttled")
+            await asyncio.sleep(retry_after)
+
+    def _backoff(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+
+        return min(0.5 * 2**attempt + random.random() / 2, self.max_backoff)
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, *, wait: bool = True, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Works like ``session.request``, use it with ``async with``.
+
+        With ``wait=False`` an exhausted rate limit raises
+        :class:`RateLimitExceeded` straight away instead of waiting it out.
+        """
+        host = URL(url).host or ""
+        upstream = self.upstream(host)
+
+        if upstream is not None:
+            name, retries = upstream.name, upstream.retries
+            connections = upstream.connections
+        else:
+            name, retries = host, self.default_retries
+            connections = self.default_connections
+
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            semaphore = self._semaphores[name] = asyncio.Semaphore(connections)
+
+        async with semaphore:
+            attempt = 0
+            while True:
+                # retries count against the limit like any other request
+                if upstream is not None:
+                    await self._acquire(upstream, wait)
+
+                self._record(name, "requests")
+                start = time.perf_counter()
+                try:
+                    response = await self.session.request(method, url, **kwargs)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    self._record(name, "errors")
+                    raise
+                finally:
+                    self.latency[name] += time.perf_counter() - start
+
+                self._record(name, f"{response.status // 100}xx")
+
+                if response.status not in self.retry_statuses or attempt >= retries:
+                    break
+
+                delay = self._backoff(response, attempt)
+                response.release()
+                self._record(name, "retries")
+                attempt += 1
+                await asyncio.sleep(delay)
+
+            try:
+                yield response
+            finally:
+                response.release()
+
+    def get(self, url: str, **kwargs: Any):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        return self.request("POST", url, **kwargs)
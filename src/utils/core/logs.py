@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import asyncpg
+
+from ..helpers import Timer
+
+if TYPE_CHECKING:
+    from bot import Bot
+
+
+class LogWriter:
+    """Write-behind buffer for the append only ``*_logs`` tables.
+
+    Listeners call :meth:`add` instead of running an ``INSERT`` each. Rows
+    are grouped per table and written with ``COPY`` once a table has
+    :attr:`max_rows` pending or every :attr:`interval` seconds, whichever
+    comes first. :meth:`stop` writes whatever is left, so call it before
+    the pool is closed.
+
+    If a flush fails because the database can't be reached the rows are put
+    back and retried on the next one, unless that would keep more than
+    :attr:`max_pending` rows around, in which case they are dropped and
+    counted in :attr:`stats`. A batch the database refuses is split until
+    the offending rows are found, those are dropped and the rest written.
+    """
+
+    max_rows: int = 500
+    max_pending: int = 50_000
+    interval: float = 5.0
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self._pending: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[Any, ...]]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._lock = asyncio.Lock()
+        self._stopping: bool = False
+
+        self.stats: Counter[str] = Counter()
+        self.last_flush: float = 0.0
+
+    @property
+    def depth(self) -> int:
+        """The number of rows waiting to be written."""
+        return sum(len(rows) for rows in self._pending.values())
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+
+        self._stopping = False
+        self._task = self.bot.loop.create_task(self.run())
+
+    async def stop(self) -> None:
+        # cancelling could interrupt a flush and lose the batch it took, so
+        # ask the loop to finish instead
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        await self.flush()
+
+    def add(self, table: str, columns: Tuple[str, ...], *values: Any) -> None:
+        rows = self._pending.setdefault((table, columns), [])
+        rows.append(values)
+        self.stats["queued"] += 1
+
+        if len(rows) >= self.max_rows:
+            self._wakeup.set()
+
+    async def _copy(
+        self, table: str, columns: Tuple[str, ...], rows: List[Tuple[Any, ...]]
+    ) -> None:
+        try:
+            await self.bot.pool.copy_records_to_table(
+                table, records=rows, columns=columns
+            )
+        except ValueError as e:
+            # asyncpg couldn't encode one of the values
+            await self._reject(table, columns, rows, e)
+        except (
+            OSError,
+            asyncio.TimeoutError,
+            asyncpg.InterfaceError,
+            asyncpg.PostgresConnectionError,
+            asyncpg.InsufficientResourcesError,
+        ) as e:
+            self.bot.logger.warning(f"Failed to write {len(rows)} rows to {table}: {e}")
+            self.stats["failed"] += len(rows)
+
+            if self.depth + len(rows) > self.max_pending:
+                self.stats["dropped"] += len(rows)
+                return
+
+            self._pending.setdefault((table, columns), [])[:0] = rows
+        except asyncpg.PostgresError as e:
+            await self._reject(table, columns, rows, e)
+        else:
+            self.stats["written"] += len(rows)
+
+    async def _reject(
+        self,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[Tuple[Any, ...]],
+        error: Exception,
+    ) -> None:
+        # retrying would fail the same way, so narrow it down to the bad rows
+        if len(rows) == 1:
+            self.bot.logger.warning(f"Dropped a row for {table}: {error}")
+            self.stats["rejected"] += 1
+            return
+
+        middle = len(rows) // 2
+        await self._copy(table, columns, rows[:middle])
+        await self._copy(table, columns, rows[middle:])
+
+    async def flush(self) -> None:
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+
+            with Timer() as timer:
+                for (table, columns), rows in pending.items():
+                    await self._copy(table, columns, rows)
+
+            self.last_flush = timer.time
+            self.stats["flushes"] += 1
+
+    async def run(self) -> None:
+        while not self._stopping and not self.bot.is_closed():
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            await self.flush()
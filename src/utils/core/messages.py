@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Union
+
+import discord
+
+from ..vars import BOT_MENTION_RE, POKETWO_ID, TATSU_ID, VIDEOS_RE
+
+if TYPE_CHECKING:
+    from bot import Bot
+
+
+@dataclass()
+class MessageFacts:
+    author_blocked: bool
+    guild_blocked: bool
+    author_afk: bool
+    afk_mentions: List[Union[discord.User, discord.Member]]
+    auto_reactions: bool
+    has_media: bool
+    auto_download: bool
+    has_video: bool
+    poketwo_hint: bool
+    tatsu: bool
+    bot_mention: bool
+
+
+class MessageRouter:
+    """Works out the cheap facts about a message once and dispatches it only
+    to the listeners that care about it.
+
+    Listeners subscribe to the routed events instead of ``on_message``:
+
+    - ``on_afk_return(message)``
+    - ``on_afk_mention(message, users)``
+    - ``on_auto_reaction_message(message)``
+    - ``on_auto_download_message(message)``
+    - ``on_poketwo_hint(message)``
+    - ``on_bot_mention(message)``
+    - ``on_tatsu_message(message)``
+
+    :attr:`stats` counts how many messages reached each listener and how
+    many were dropped at each stage.
+    """
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self.stats: Counter[str] = Counter()
+
+    def classify(self, message: discord.Message) -> MessageFacts:
+        assert message.guild is not None
+
+        mirror = self.bot.mirror
+        author_afk = mirror.contains("afk_users", message.author.id)
+        video = VIDEOS_RE.search(message.content)
+        me = message.guild.me
+
+        return MessageFacts(
+            author_blocked=mirror.contains("block_list", message.author.id),
+            guild_blocked=mirror.contains("block_list", message.guild.id)
+            or mirror.contains("block_list", message.guild.owner_id),
+            author_afk=author_afk,
+            afk_mentions=(
+                []
+                if author_afk
+                else [u for u in message.mentions if mirror.contains("afk_users", u.id)]
+            ),
+            auto_reactions=mirror.contains("auto_reactions", message.guild.id),
+            has_media=bool(message.attachments)
+            or any(embed.type != "rich" for embed in message.embeds),
+            auto_download=mirror.contains("auto_download_channels", message.channel.id)
+            and message.author.id != me.id
+            and message.channel.permissions_for(me).send_messages,
+            has_video=video is not None and video.group(0) != "",
+            poketwo_hint=message.author.id == POKETWO_ID
+            and mirror.contains("poketwo_guilds", message.guild.id)
+            and r"\_" in message.content,
+            tatsu=message.author.id == TATSU_ID,
+            bot_mention=BOT_MENTION_RE.fullmatch(message.content) is not None,
+        )
+
+    def route(self, message: discord.Message) -> None:
+        self.stats["seen"] += 1
+
+        if message.guild is None:
+            self.stats["dropped:dm"] += 1
+            return
+
+        facts = self.classify(message)
+        human = not message.author.bot
+        routed = False
+
+        def dispatch(event: str, *args) -> None:
+            nonlocal routed
+            routed = True
+            self.stats[event] += 1
+            self.bot.dispatch(event, message, *args)
+
+        if facts.author_afk:
+            dispatch("afk_return")
+
+        if facts.afk_mentions:
+            dispatch("afk_mention", facts.afk_mentions)
+
+        if human and facts.auto_reactions and facts.has_media:
+            dispatch("auto_reaction_message")
+
+        if (
+            human
+            and facts.auto_download
+            and facts.has_video
+            and not facts.author_blocked
+            and not facts.guild_blocked
+        ):
+            dispatch("auto_download_message")
+
+        if facts.poketwo_hint and not facts.guild_blocked:
+            dispatch("poketwo_hint")
+
+        if facts.bot_mention:
+            dispatch("bot_mention")
+
+        if facts.tatsu:
+            dispatch("tatsu_message")
+
+        if not routed:
+            self.stats["dropped:unrouted"] += 1
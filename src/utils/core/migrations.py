@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import pathlib
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+import asyncpg
+
+from ..vars import MigrationError
+
+MIGRATIONS_PATH = pathlib.Path("migrations")
+
+# any constant works, it only has to be the same for every process
+MIGRATIONS_LOCK: int = 7_321_654_987
+
+NO_TRANSACTION = "-- migrate: no-transaction"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single ``<version>_<name>.sql`` file in the migrations folder.
+
+    Migrations run inside a transaction unless the file starts with
+    ``-- migrate: no-transaction``, which ``CREATE INDEX CONCURRENTLY`` needs.
+    Those are run one statement at a time, so they can't contain function
+    bodies and every statement has to be safe to run twice.
+    """
+
+    version: int
+    name: str
+    sql: str
+
+    def __str__(self) -> str:
+        return f"{self.version:04}_{self.name}"
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+    @property
+    def transactional(self) -> bool:
+        return not self.sql.lstrip().startswith(NO_TRANSACTION)
+
+    def statements(self) -> List[str]:
+        statements = []
+        for statement in re.split(r";\s*$", self.sql, flags=re.M):
+            lines = [
+                l for l in statement.splitlines() if not l.strip().startswith("--")
+            ]
+            if "".join(lines).strip():
+                statements.append(statement.strip())
+
+        return statements
+
+
+def load_migrations(path: pathlib.Path = MIGRATIONS_PATH) -> List[Migration]:
+    migrations: Dict[int, Migration] = {}
+
+    for file in path.glob("*.sql"):
+        match = re.fullmatch(r"(\d+)_(\w+)\.sql", file.name)
+        if match is None:
+            raise MigrationError(f"Badly named migration file {file.name}")
+
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Migration version {version} is used twice")
+
+        migrations[version] = Migration(
+            version, match.group(2), file.read_text(encoding="utf-8")
+        )
+
+    return [migrations[version] for version in sorted(migrations)]
+
+
+async def _apply(conn: asyncpg.Connection, migration: Migration) -> None:
+    sql = "INSERT INTO schema_migrations (version, name, checksum) VALUES ($1, $2, $3)"
+
+    if migration.transactional:
+        async with conn.transaction():
+            await conn.execute(migration.sql)
+            await conn.execute(
+                sql, migration.version, migration.name, migration.checksum
+            )
+        return
+
+    for statement in migration.statements():
+        await conn.execute(statement)
+
+    await conn.execute(sql, migration.version, migration.name, migration.checksum)
+
+
+async def run_migrations(
+    pool: asyncpg.Pool, *, path: pathlib.Path = MIGRATIONS_PATH
+) -> List[Migration]:
+    """Applies every migration that hasn't been applied yet, in order.
+
+    Raises :class:`MigrationError` if an applied migration was edited
+    afterwards. Returns the migrations that were applied.
+    """
+    migrations = load_migrations(path)
+    applied: List[Migration] = []
+
+    async with pool.acquire() as conn:
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT,
+                checksum TEXT,
+                applied_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+            )
+            """)
+
+        # several processes may start at once, only one of them migrates
+        await conn.execute("SELECT pg_advisory_lock($1)", MIGRATIONS_LOCK)
+        try:
+            records = await conn.fetch(
+                "SELECT version, checksum FROM schema_migrations"
+            )
+            checksums = {record["version"]: record["checksum"] for record in records}
+
+            for migration in migrations:
+                checksum = checksums.get(migration.version)
+                if checksum is None:
+                    await _apply(conn, migration)
+                    applied.append(migration)
+                elif checksum != migration.checksum:
+                    raise MigrationError(
+                        f"Migration {migration} was changed after it was applied"
+                    )
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATIONS_LOCK)
+
+    return applied
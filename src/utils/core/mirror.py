@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+import aioredis
+
+if TYPE_CHECKING:
+    from aioredis.client import PubSub
+
+    from bot import Bot
+
+
+class SetMirror:
+    """Process-local copies of the redis sets read on (nearly) every message.
+
+    Membership checks are answered from memory instead of pulling the
+    whole set with ``SMEMBERS``. Writes go through :meth:`add` and
+    :meth:`remove`, which update redis and then publish the key so every
+    process re-reads it.
+    """
+
+    channel: str = "mirrored_sets"
+    keys: Tuple[str, ...] = (
+        "block_list",
+        "afk_users",
+        "auto_reactions",
+        "poketwo_guilds",
+        "auto_download_channels",
+        "fm_autoreactions",
+        "nsfw_covers",
+    )
+    prefixes: Tuple[str, ...] = ("opted_out:",)
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self._sets: Dict[str, Set[str]] = {}
+        self._pubsub: Optional[PubSub] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        # subscribe first so nothing published while loading is missed
+        self._pubsub = self.bot.redis.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        await self.load()
+        self._task = self.bot.loop.create_task(self.listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.close()
+            self._pubsub = None
+
+    async def load(self) -> None:
+        keys: List[str] = list(self.keys)
+        for prefix in self.prefixes:
+            keys.extend([key async for key in self.bot.redis.scan_iter(f"{prefix}*")])
+
+        async with self.bot.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.smembers(key)
+
+            results: List[Set[str]] = await pipe.execute()
+
+        self._sets = dict(zip(keys, results))
+
+    async def refresh(self, key: str) -> None:
+        self._sets[key] = await self.bot.redis.smembers(key)
+
+    async def _reconnect(self) -> None:
+        # anything published while disconnected is lost, so start over
+        delay = 1.0
+        while not self.bot.is_closed():
+            try:
+                if self._pubsub is not None:
+                    await self._pubsub.close()
+
+                self._pubsub = self.bot.redis.pubsub()
+                await self._pubsub.subscribe(self.channel)
+                await self.load()
+            except (aioredis.ConnectionError, OSError) as e:
+                self.bot.logger.warning(
+                    f"Failed to reload mirrored sets, retrying in {delay:.0f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+            else:
+                self.bot.logger.info("Reloaded mirrored sets after losing redis")
+                return
+
+    async def listen(self) -> None:
+        while not self.bot.is_closed():
+            assert self._pubsub is not None
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] == "message":
+                        await self.refresh(message["data"])
+            except (aioredis.ConnectionError, OSError) as e:
+                self.bot.logger.warning(f"Lost the mirrored sets subscription: {e}")
+                await self._reconnect()
+
+    def contains(self, key: str, member: Any) -> bool:
+        return str(member) in self._sets.get(key, ())
+
+    def members(self, key: str) -> Set[str]:
+        return set(self._sets.get(key, ()))
+
+    async def add(self, key: str, *members: Any) -> None:
+        await self.bot.redis.sadd(key, *members)
+        self._sets.setdefault(key, set()).update(str(m) for m in members)
+        await self.bot.redis.publish(self.channel, key)
+
+    async def remove(self, key: str, *members: Any) -> None:
+        await self.bot.redis.srem(key, *members)
+        self._sets.setdefault(key, set()).difference_update(str(m) for m in members)
+        await self.bot.redis.publish(self.channel, key)
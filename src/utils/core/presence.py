@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import asyncpg
+import discord
+
+from ..helpers import Timer
+
+if TYPE_CHECKING:
+    from bot import Bot
+
+
+class PresenceWriter:
+    """Collapses status changes before they reach the database.
+
+    A member's status update fires once per shared guild and people flip
+    between online/idle/dnd constantly, but only the latest change per user
+    matters for ``uptime_logs``. Changes are kept per user in memory and
+    upserted in a single statement every :attr:`interval` seconds.
+
+    Every change also closes the user's current session. Closed sessions
+    are appended to ``presence_sessions`` through :attr:`Bot.logs` and
+    their length is added to ``presence_daily``, one row per user, day and
+    status, so "time online this week" never has to scan the raw sessions.
+    """
+
+    interval: float = 2.0
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self._pending: Dict[int, datetime.datetime] = {}
+        # user_id -> (status, started_at) of the session currently open
+        self._sessions: Dict[int, Tuple[str, datetime.datetime]] = {}
+        # (user_id, day, status) -> seconds not yet added to presence_daily
+        self._daily: Counter[Tuple[int, datetime.date, str]] = Counter()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._lock = asyncio.Lock()
+        self._stopping: bool = False
+
+        self.stats: Counter[str] = Counter()
+        self.last_flush: float = 0.0
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+
+        self._stopping = False
+        self._task = self.bot.loop.create_task(self.run())
+
+    async def stop(self) -> None:
+        # cancelling could interrupt a flush after it took the batch, so ask
+        # the loop to finish instead
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        # we can't tell what happens while we're offline, so end every session
+        now = discord.utils.utcnow()
+        for user_id in list(self._sessions):
+            self._close(user_id, now)
+
+        await self.flush()
+
+    def update(self, user_id: int, status: str, time: datetime.datetime) -> None:
+        self.stats["updates"] += 1
+
+        current = self._sessions.get(user_id)
+        if current is not None and current[0] == status:
+            # the same change seen through another shared guild
+            return
+
+        self._pending[user_id] = time
+        self._close(user_id, time)
+        self._sessions[user_id] = (status, time)
+
+    def _close(self, user_id: int, end: datetime.datetime) -> None:
+        try:
+            status, start = self._sessions.pop(user_id)
+        except KeyError:
+            return
+
+        if end <= start:
+            return
+
+        self.stats["sessions"] += 1
+        self.bot.logs.add(
+            "presence_sessions",
+            ("user_id", "status", "started_at", "ended_at"),
+            user_id,
+            status,
+            start,
+            end,
+        )
+
+        for day, seconds in _split_by_day(start, end):
+            self._daily[(user_id, day, status)] += seconds
+
+    def last_seen(self, user_id: int) -> Optional[datetime.datetime]:
+        """The change for this user that hasn't been written yet, if any."""
+        return self._pending.get(user_id)
+
+    async def online_time(self, user_id: int, days: int = 7) -> Dict[str, float]:
+        """Seconds spent in each status over the last ``days`` days, today included."""
+        now = discord.utils.utcnow()
+        since = now.date() - datetime.timedelta(days=days - 1)
+
+        query = """SELECT status, SUM(seconds) AS seconds FROM presence_daily
+                   WHERE user_id = $1 AND day >= $2
+                   GROUP BY status
+                """
+        records = await self.bot.pool.fetch(query, user_id, since)
+        totals: Dict[str, float] = {r["status"]: r["seconds"] for r in records}
+
+        for (uid, day, status), seconds in self._daily.items():
+            if uid == user_id and day >= since:
+                totals[status] = totals.get(status, 0) + seconds
+
+        current = self._sessions.get(user_id)
+        if current is not None:
+            status, start = current
+            for day, seconds in _split_by_day(start, now):
+                if day >= since:
+                    totals[status] = totals.get(status, 0) + seconds
+
+        return totals
+
+    async def _write_uptime(self, pending: Dict[int, datetime.datetime]) -> None:
+        query = """INSERT INTO uptime_logs (user_id, time)
+                   SELECT * FROM unnest($1::BIGINT[], $2::TIMESTAMPTZ[])
+                   ON CONFLICT (user_id) DO UPDATE SET time = EXCLUDED.time
+                """
+        await self.bot.pool.execute(query, list(pending.keys()), list(pending.values()))
+
+    async def _write_daily(
+        self, daily: Counter[Tuple[int, datetime.date, str]]
+    ) -> None:
+        query = """INSERT INTO presence_daily (user_id, day, status, seconds)
+                   SELECT * FROM unnest($1::BIGINT[], $2::DATE[], $3::TEXT[], $4::INT[])
+                   ON CONFLICT (user_id, day, status)
+                   DO UPDATE SET seconds = presence_daily.seconds + EXCLUDED.seconds
+                """
+        keys = list(daily.keys())
+        await self.bot.pool.execute(
+            query,
+            [user_id for user_id, _, _ in keys],
+            [day for _, day, _ in keys],
+            [status for _, _, status in keys],
+            [round(daily[key]) for key in keys],
+        )
+
+    async def flush(self) -> None:
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            daily, self._daily = self._daily, Counter()
+            if not pending and not daily:
+                return
+
+            written = len(pending) + len(daily)
+            try:
+                with Timer() as timer:
+                    if pending:
+                        await self._write_uptime(pending)
+                        pending = {}
+                    if daily:
+                        await self._write_daily(daily)
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                self.bot.logger.warning(f"Failed to write presences: {e}")
+                # anything newer that came in meanwhile wins
+                self._pending = {**pending, **self._pending}
+                self._daily.update(daily)
+                return
+
+            self.last_flush = timer.time
+            self.stats["written"] += written
+            self.stats["flushes"] += 1
+
+    async def run(self) -> None:
+        while not self._stopping and not self.bot.is_closed():
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                # keep writing the next batches rather than dying silently
+                self.bot.logger.error("Unexpected error writing presences", exc_info=e)
+
+
+def _split_by_day(
+    start: datetime.datetime, end: datetime.datetime
+) -> List[Tuple[datetime.date, float]]:
+    """Splits a span into the seconds it covers of each UTC day."""
+    start = start.astimezone(datetime.timezone.utc)
+    end = end.astimezone(datetime.timezone.utc)
+
+    parts: List[Tuple[datetime.date, float]] = []
+    while start < end:
+        midnight = datetime.datetime.combine(
+            start.date() + datetime.timedelta(days=1),
+            datetime.time(),
+            tzinfo=datetime.timezone.utc,
+        )
+        stop = min(midnight, end)
+        parts.append((start.date(), (stop - start).total_seconds()))
+        start = stop
+
+    return parts
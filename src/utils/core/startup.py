@@ -1,59 +1,97 @@
 from __future__ import annotations
 
+import asyncio
+import csv
 import json
-import re
-from typing import TYPE_CHECKING
+import pathlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
+import aiohttp
 import asyncpg
 import discord
-import pandas as pd
-from tweepy.asynchronous import AsyncClient
 
-from ..helpers import add_prefix
+from ..helpers import PokemonIndex, Timer, add_prefix, response_checker
+from ..vars import ResponseError
 
 if TYPE_CHECKING:
     from bot import Bot
 
 
+async def _timed_fetch(
+    bot: Bot, timings: Dict[str, float], table: str, query: str
+) -> List[asyncpg.Record]:
+    with Timer() as timer:
+        records = await bot.pool.fetch(query)
+
+    timings[table] = timer.time
+    return records
+
+
+def _log_timings(bot: Bot, name: str, timings: Dict[str, float]):
+    breakdown = ", ".join(f"{k} {v * 1000:.2f}ms" for k, v in timings.items())
+    bot.logger.info(f"Warmed up {name}: {breakdown}")
+
+
 async def setup_cache(bot: Bot):
-    prefixes = await bot.pool.fetch("SELECT * FROM guild_prefixes")
+    timings: Dict[str, float] = {}
+
+    (
+        prefixes,
+        guild_settings,
+        blacklisted,
+        afk,
+        covers,
+        opted_out,
+        user_settings,
+    ) = await asyncio.gather(
+        _timed_fetch(bot, timings, "guild_prefixes", "SELECT * FROM guild_prefixes"),
+        _timed_fetch(bot, timings, "guild_settings", "SELECT * FROM guild_settings"),
+        _timed_fetch(bot, timings, "block_list", "SELECT snowflake FROM block_list"),
+        _timed_fetch(bot, timings, "afk", "SELECT user_id FROM afk"),
+        _timed_fetch(bot, timings, "nsfw_covers", "SELECT album_id FROM nsfw_covers"),
+        _timed_fetch(bot, timings, "opted_out", "SELECT * FROM opted_out"),
+        _timed_fetch(bot, timings, "user_settings", "SELECT * FROM user_settings"),
+    )
+
     for record in prefixes:
         add_prefix(bot, record["guild_id"], record["prefix"])
 
-    guild_settings = await bot.pool.fetch("SELECT * FROM guild_settings")
-    for guild in guild_settings:
-        if guild["poketwo"]:
-            await bot.redis.sadd("poketwo_guilds", guild["guild_id"])
-        if guild["auto_download"]:
-            await bot.redis.sadd("auto_download_channels", guild["auto_download"])
+    # fmt: off
+    sets: Dict[str, List[Any]] = {
+        "poketwo_guilds": [row["guild_id"] for row in guild_settings if row["poketwo"]],
+        "auto_download_channels": [row["auto_download"] for row in guild_settings if row["auto_download"]],
+        "auto_reactions": [row["guild_id"] for row in guild_settings if row["auto_reactions"]],
+        "block_list": [row["snowflake"] for row in blacklisted],
+        "afk_users": [row["user_id"] for row in afk],
+        "nsfw_covers": [row["album_id"] for row in covers],
+        "fm_autoreactions": [row["user_id"] for row in user_settings if row["fm_autoreact"]],
+        "mudae_pokemon_reminders": [row["user_id"] for row in user_settings if row["mudae_pokemon"]],
+    }
+    # fmt: on
 
-        if guild["auto_reactions"]:
-            await bot.redis.sadd("auto_reactions", guild["guild_id"])
-
-    blacklisted = await bot.pool.fetch("SELECT snowflake FROM block_list")
-    for snowflake in blacklisted:
-        await bot.redis.sadd("block_list", snowflake["snowflake"])
+    for row in opted_out:
+        sets[f"opted_out:{row['user_id']}"] = row["items"] or []
 
-    afk = await bot.pool.fetch("SELECT * FROM afk")
-    for row in afk:
-        await bot.redis.sadd("afk_users", row["user_id"])
+    with Timer() as timer:
+        # users whose row was deleted while we were offline
+        stale = [
+            key async for key in bot.redis.scan_iter("opted_out:*") if key not in sets
+        ]
 
-    covers = await bot.pool.fetch("SELECT * FROM nsfw_covers")
-    for row in covers:
-        await bot.redis.sadd("nsfw_covers", row["album_id"])
+        # rebuilt in one transaction so nothing ever sees a half empty set
+        async with bot.redis.pipeline(transaction=True) as pipe:
+            if stale:
+                pipe.delete(*stale)
 
-    opted_out = await bot.pool.fetch("SELECT * FROM opted_out")
-    for row in opted_out:
-        for item in row["items"]:
-            await bot.redis.sadd(f"opted_out:{row['user_id']}", item)
+            for key, members in sets.items():
+                pipe.delete(key)
+                if members:
+                    pipe.sadd(key, *members)
 
-    user_settings = await bot.pool.fetch("SELECT * FROM user_settings")
-    for row in user_settings:
-        if row["fm_autoreact"]:
-            await bot.redis.sadd("fm_autoreactions", row["user_id"])
+            await pipe.execute()
 
-        if row["mudae_pokemon"]:
-            await bot.redis.sadd("mudae_pokemon_reminders", row["user_id"])
+    timings["redis"] = timer.time
+    _log_timings(bot, "cache", timings)
 
 
 async def setup_webhooks(bot: Bot):
@@ -76,43 +114,96 @@ async def setup_webhooks(bot: Bot):
         )
 
 
+POKEMON_URL = "https://raw.githubusercontent.com/poketwo/data/master/csv/pokemon.csv"
+POKEMON_CACHE = pathlib.Path("src/files/cache/pokemon.csv")
+POKEMON_CACHE_META = POKEMON_CACHE.with_suffix(".json")
+
+
+def _load_pokemon(bot: Bot) -> None:
+    with POKEMON_CACHE.open(encoding="utf-8", newline="") as f:
+        names = [row["name.en"] for row in csv.DictReader(f)]
+
+    bot.pokemon = PokemonIndex(names)
+
+
+async def refresh_pokemon(bot: Bot) -> bool:
+    """Downloads the Pokétwo dataset if it changed since the cached copy.
+
+    Returns whether anything was downloaded.
+    """
+    headers: Dict[str, str] = {}
+    if POKEMON_CACHE.exists() and POKEMON_CACHE_META.exists():
+        meta = json.loads(POKEMON_CACHE_META.read_text())
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    async with bot.session.get(POKEMON_URL, headers=headers) as r:
+        if r.status == 304:
+            return False
+
+        response_checker(r)
+        data = await r.read()
+        meta = {
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+        }
+
+    POKEMON_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    POKEMON_CACHE.write_bytes(data)
+    POKEMON_CACHE_META.write_text(json.dumps(meta))
+    _load_pokemon(bot)
+    return True
+
+
 async def setup_pokemon(bot: Bot):
-    url = "https://raw.githubusercontent.com/poketwo/data/master/csv/pokemon.csv"
-    data = pd.read_csv(url)
-    pokemon = [str(p).lower() for p in data["name.en"]]
+    if not POKEMON_CACHE.exists():
+        await refresh_pokemon(bot)
+        return
+
+    # boot from the cached copy and only check for changes in the background
+    _load_pokemon(bot)
 
-    for p in pokemon:
-        if re.search(r"[\U00002640\U0000fe0f|\U00002642\U0000fe0f]", p):
-            pokemon[pokemon.index(p)] = re.sub(
-                "[\U00002640\U0000fe0f|\U00002642\U0000fe0f]", "", p
-            )
-        if re.search(r"[\U000000e9]", p):
-            pokemon[pokemon.index(p)] = re.sub("[\U000000e9]", "e", p)
+    async def refresh():
+        try:
+            await refresh_pokemon(bot)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ResponseError) as e:
+            bot.logger.warning(f"Failed to refresh the pokemon dataset: {e}")
 
-    bot.pokemon = pokemon
+    bot.loop.create_task(refresh())
 
 
 async def setup_accounts(bot: Bot):
-    accounts = await bot.pool.fetch("SELECT * FROM accounts")
-    for record in accounts:
-        if record["osu"]:
-            await bot.redis.hset(f"accounts:{record['user_id']}", "osu", record["osu"])
-        if record["lastfm"]:
-            await bot.redis.hset(
-                f"accounts:{record['user_id']}", "lastfm", record["lastfm"]
-            )
-        if record["steam"]:
-            await bot.redis.hset(
-                f"accounts:{record['user_id']}", "steam", record["steam"]
-            )
-        if record["roblox"]:
-            await bot.redis.hset(
-                f"accounts:{record['user_id']}", "roblox", record["roblox"]
-            )
-        if record["genshin"]:
-            await bot.redis.hset(
-                f"accounts:{record['user_id']}", "genshin", record["genshin"]
-            )
+    timings: Dict[str, float] = {}
+    accounts = await _timed_fetch(bot, timings, "accounts", "SELECT * FROM accounts")
+
+    with Timer() as timer:
+        keys = {f"accounts:{record['user_id']}" for record in accounts}
+        stale = [
+            key async for key in bot.redis.scan_iter("accounts:*") if key not in keys
+        ]
+
+        async with bot.redis.pipeline(transaction=True) as pipe:
+            if stale:
+                pipe.delete(*stale)
+
+            for record in accounts:
+                key = f"accounts:{record['user_id']}"
+                mapping = {
+                    service: record[service]
+                    for service in ("osu", "lastfm", "steam", "roblox", "genshin")
+                    if record[service]
+                }
+
+                pipe.delete(key)
+                if mapping:
+                    pipe.hset(key, mapping=mapping)
+
+            await pipe.execute()
+
+    timings["redis"] = timer.time
+    _log_timings(bot, "accounts", timings)
 
 
 async def create_pool(bot: Bot, connection_url: str):
@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import heapq
+import itertools
+import json
+import math
+import secrets
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import asyncpg
+import discord
+
+from ..helpers import PGTimer
+
+if TYPE_CHECKING:
+    from bot import Bot
+
+
+class TimingWheel:
+    """Schedules the timers that expire within a minute.
+
+    Each slot covers one second and a single task advances the wheel, so
+    inserting is O(1) and thousands of short timers don't each need their
+    own sleeping task. Timers fire up to a second late, never early.
+
+    When ``persist`` is set every timer is also written to a redis hash
+    before it is scheduled, and anything left in there is rescheduled on
+    start, so short timers survive restarts.
+    """
+
+    def __init__(self, bot: Bot, *, key: str, persist: bool = False, slots: int = 64):
+        self.bot: Bot = bot
+        self.key: str = key
+        self.persist: bool = persist
+        self._slots: List[List[Tuple[str, PGTimer]]] = [[] for _ in range(slots)]
+        # tokens in the wheel, only kept with persist so a restore that races
+        # an add, or runs again after stop/start, doesn't place a timer twice
+        self._tokens: Set[str] = set()
+        self._tick: int = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __len__(self) -> int:
+        return sum(len(slot) for slot in self._slots)
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+
+        self._task = self.bot.loop.create_task(self.run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _place(self, token: str, timer: PGTimer) -> None:
+        if self.persist:
+            if token in self._tokens:
+                return
+
+            self._tokens.add(token)
+
+        delay = (timer.expires - datetime.datetime.utcnow()).total_seconds()
+        # the current slot is already part way through, hence the extra tick
+        ticks = min(max(math.ceil(delay), 0) + 1, len(self._slots) - 1)
+        self._slots[(self._tick + ticks) % len(self._slots)].append((token, timer))
+
+    async def add(self, timer: PGTimer) -> None:
+        token = secrets.token_hex(8)
+
+        if self.persist:
+            data = {
+                "event": timer.event,
+                "args": timer.args,
+                "kwargs": timer.kwargs,
+                "created": timer.created_at.isoformat(),
+                "expires": timer.expires.isoformat(),
+                "owner_id": timer.owner_id,
+            }
+            await self.bot.redis.hset(self.key, token, json.dumps(data))
+
+        self._place(token, timer)
+
+    async def restore(self) -> None:
+        saved: Dict[str, str] = await self.bot.redis.hgetall(self.key)
+
+        for token, value in saved.items():
+            data = json.loads(value)
+            timer = PGTimer.temporary(
+                event=data["event"],
+                args=data["args"],
+                kwargs=data["kwargs"],
+                created=datetime.datetime.fromisoformat(data["created"]),
+                expires=datetime.datetime.fromisoformat(data["expires"]),
+                owner_id=data.get("owner_id"),
+            )
+            self._place(token, timer)
+
+    async def run(self) -> None:
+        if self.persist:
+            await self.restore()
+
+        next_tick = self.bot.loop.time()
+        while not self.bot.is_closed():
+            next_tick += 1
+            await asyncio.sleep(max(next_tick - self.bot.loop.time(), 0))
+
+            self._tick = (self._tick + 1) % len(self._slots)
+            due, self._slots[self._tick] = self._slots[self._tick], []
+            if not due:
+                continue
+
+            for _, timer in due:
+                event_name = f"{timer.event}_timer_complete"
+                self.bot.dispatch(event_name, timer)
+
+            if self.persist:
+                tokens = [token for token, _ in due]
+                self._tokens.difference_update(tokens)
+                await self.bot.redis.hdel(self.key, *tokens)
+
+
+class TimerManager:
+    """Owns the single reminder dispatch loop for the bot.
+
+    Cogs create timers through :meth:`create_timer` and receive them by
+    listening for ``on_{event}_timer_complete``.
+
+    The reminders table sends a notification on every change, so timers
+    inserted or deleted by other processes wake the loop straight away.
+    With several processes running, each one only schedules the timers
+    whose ``id % partitions`` matches its own ``partition``.
+    """
+
+    # how many upcoming timers are pulled into memory per round trip
+    prefetch_size: int = 1000
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self._heap: List[Tuple[datetime.datetime, int, int, PGTimer]] = []
+        # timer id -> version of its current heap entry, any other entry for
+        # the same id is left over from before it was rescheduled
+        self._scheduled: Dict[int, int] = {}
+        self._versions = itertools.count()
+        # every timer expiring before this is guaranteed to be in the heap
+        self._horizon: Optional[datetime.datetime] = None
+        # bumped whenever the horizon is invalidated, so a prefetch that was
+        # already running doesn't put back a horizon that's out of date
+        self._generation: int = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._listener: Optional[asyncpg.Connection] = None
+        self._relisten_task: Optional[asyncio.Task[None]] = None
+
+        config = bot.config.get("timers", {})
+        self.partitions: int = config.get("partitions", 1)
+        self.partition: int = config.get("partition", 0)
+        self.short_timers = TimingWheel(
+            bot,
+            key=f"short_timers:{self.partition}",
+            persist=config.get("persist_short_timers", False),
+        )
+
+    def start(self) -> None:
+        self.short_timers.start()
+
+        if self._task is not None and not self._task.done():
+            return
+
+        self._task = self.bot.loop.create_task(self.dispatch_timers())
+
+    async def stop(self) -> None:
+        self.short_timers.stop()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._relisten_task is not None:
+            self._relisten_task.cancel()
+            self._relisten_task = None
+
+        await self._unlisten()
+
+    def owns(self, timer_id: int) -> bool:
+        return timer_id % self.partitions == self.partition
+
+    async def _listen(self) -> None:
+        if self._listener is not None:
+            return
+
+        listener = await self.bot.pool.acquire()
+        if self._listener is not None:
+            # the reconnect task got there first
+            await self.bot.pool.release(listener)
+            return
+
+        try:
+            await listener.add_listener("reminders", self._on_notification)
+        except BaseException:
+            await self.bot.pool.release(listener)
+            raise
+
+        listener.add_termination_listener(self._on_termination)
+        self._listener = listener
+
+    async def _unlisten(self) -> None:
+        if self._listener is None:
+            return
+
+        listener, self._listener = self._listener, None
+        listener.remove_termination_listener(self._on_termination)
+        try:
+            await listener.remove_listener("reminders", self._on_notification)
+        except (OSError, asyncpg.InterfaceError, asyncpg.PostgresConnectionError):
+            pass
+
+        await self.bot.pool.release(listener)
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        if connection is not self._listener:
+            return
+
+        self.bot.logger.warning("Lost the reminders listener, reconnecting")
+        self._listener = None
+        self.bot.loop.create_task(self.bot.pool.release(connection))
+
+        if self._relisten_task is None or self._relisten_task.done():
+            self._relisten_task = self.bot.loop.create_task(self._relisten())
+
+    async def _relisten(self) -> None:
+        delay = 1.0
+        while not self.bot.is_closed():
+            try:
+                await self._listen()
+            except (OSError, asyncpg.InterfaceError, asyncpg.PostgresError) as e:
+                self.bot.logger.warning(
+                    f"Failed to listen for reminders, retrying in {delay:.0f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 300.0)
+                continue
+
+            # anything inserted while we weren't listening was never announced
+            self._invalidate()
+            return
+
+    def _invalidate(self) -> None:
+        self._generation += 1
+        self._horizon = None
+        self._wakeup.set()
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        data = json.loads(payload)
+        timer_id: int = data["id"]
+
+        if not self.owns(timer_id):
+            return
+
+        if data["op"] != "INSERT":
+            # deleted or rescheduled, either way the copy we hold is stale
+            self.discard([timer_id])
+
+        if data["op"] == "DELETE" or timer_id in self._scheduled:
+            return
+
+        if data["expires"] is None:
+            return
+
+        expires = datetime.datetime.fromisoformat(data["expires"])
+        if self._horizon is not None and expires < self._horizon:
+            # force a prefetch so the new timer is loaded with its data
+            self._invalidate()
+
+    async def create_timer(
+        self, when: datetime.datetime, event: str, /, *args: Any, **kwargs: Any
+    ) -> PGTimer:
+        r"""Creates a timer.
+        Parameters
+        -----------
+        when: datetime.datetime
+            When the timer should fire.
+        event: str
+            The name of the event to trigger.
+            Will transform to 'on_{event}_timer_complete'.
+        \*args
+            Arguments to pass to the event
+        \*\*kwargs
+            Keyword arguments to pass to the event
+        connection: asyncpg.Connection
+            Special keyword-only argument to use a specific connection
+            for the DB request.
+        created: datetime.datetime
+            Special keyword-only argument to use as the creation time.
+            Should make the timedeltas a bit more consistent.
+        owner_id: int
+            Special keyword-only argument for the user the timer belongs to.
+            Stored in its own indexed column for per-user lookups.
+        Note
+        ------
+        Arguments and keyword arguments must be JSON serialisable.
+        Returns
+        --------
+        :class:`Timer`
+        """
+
+        pool = self.bot.pool
+
+        try:
+            now = kwargs.pop("created")
+        except KeyError:
+            now = discord.utils.utcnow()
+
+        owner_id: Optional[int] = kwargs.pop("owner_id", None)
+
+        # Remove timezone information since the database does not deal with it
+        when = when.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        now = now.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+        timer = PGTimer.temporary(
+            event=event,
+            args=args,
+            kwargs=kwargs,
+            expires=when,
+            created=now,
+            owner_id=owner_id,
+        )
+        delta = (when - now).total_seconds()
+        if delta <= 60:
+            # a shortcut for small timers
+            await self.short_timers.add(timer)
+            return timer
+
+        query = """INSERT INTO reminders (event, extra, expires, created, owner_id)
+                   VALUES ($1, $2::jsonb, $3, $4, $5)
+                   RETURNING id;
+                """
+
+        row = await pool.fetchrow(
+            query, event, {"args": args, "kwargs": kwargs}, when, now, owner_id
+        )
+        timer.id = row[0]
+
+        # timers past the horizon get picked up by the next prefetch
+        if self.owns(timer.id) and (self._horizon is None or when < self._horizon):
+            self._push(timer)
+            self._wakeup.set()
+
+        return timer
+
+    def discard(self, ids: Sequence[int]) -> None:
+        """Forgets timers that were deleted from the database elsewhere."""
+        for timer_id in ids:
+            self._scheduled.pop(timer_id, None)
+
+        self._wakeup.set()
+
+    def _push(self, timer: PGTimer) -> None:
+        if timer.id in self._scheduled:
+            return
+
+        version = next(self._versions)
+        self._scheduled[timer.id] = version
+        heapq.heappush(self._heap, (timer.expires, timer.id, version, timer))
+
+    def _peek(self) -> Optional[PGTimer]:
+        # discarded and rescheduled entries are removed lazily
+        while self._heap:
+            _, timer_id, version, timer = self._heap[0]
+            if self._scheduled.get(timer_id) == version:
+                return timer
+
+            heapq.heappop(self._heap)
+
+        return None
+
+    def _pop_due(self, now: datetime.datetime) -> List[PGTimer]:
+        due: List[PGTimer] = []
+        while (timer := self._peek()) is not None and timer.expires <= now:
+            heapq.heappop(self._heap)
+            del self._scheduled[timer.id]
+            due.append(timer)
+
+        return due
+
+    async def prefetch_timers(self) -> None:
+        # can only asyncio.sleep for up to ~48 days reliably
+        # so we're gonna cap it off at 40 days
+        # see: http://bugs.python.org/issue20493
+        horizon = datetime.datetime.utcnow() + datetime.timedelta(days=40)
+        generation = self._generation
+
+        query = """SELECT * FROM reminders
+                   WHERE expires < $1 AND id % $3 = $4
+                   ORDER BY expires
+                   LIMIT $2;
+                """
+        records = await self.bot.pool.fetch(
+            query, horizon, self.prefetch_size, self.partitions, self.partition
+        )
+
+        for record in records:
+            self._push(PGTimer(record=record))
+
+        if len(records) == self.prefetch_size:
+            # there may be more rows sharing the last expiry
+            horizon = records[-1]["expires"]
+
+        if generation == self._generation:
+            self._horizon = horizon
+
+    async def call_timers(self, timers: List[PGTimer]) -> None:
+        # only dispatch the timers we actually managed to delete, anything
+        # missing was cancelled or fired by another process in the meantime
+        query = "DELETE FROM reminders WHERE id = ANY($1::int[]) RETURNING id;"
+        records = await self.bot.pool.fetch(query, [timer.id for timer in timers])
+        deleted = {record["id"] for record in records}
+
+        for timer in timers:
+            if timer.id not in deleted:
+                continue
+
+            event_name = f"{timer.event}_timer_complete"
+            self.bot.dispatch(event_name, timer)
+
+    async def dispatch_timers(self) -> None:
+        try:
+            await self._listen()
+
+            while not self.bot.is_closed():
+                # cleared before anything is read, so a wakeup that comes in
+                # while we're busy below is still there when we go to sleep
+                self._wakeup.clear()
+
+                due = self._pop_due(datetime.datetime.utcnow())
+                if due:
+                    await self.call_timers(due)
+                    continue
+
+                timer = self._peek()
+                if (
+                    self._horizon is None
+                    or timer is None
+                    or timer.expires >= self._horizon
+                ):
+                    await self.prefetch_timers()
+
+                    timer = self._peek()
+                    if timer and timer.expires <= datetime.datetime.utcnow():
+                        continue
+
+                if self._horizon is None:
+                    # invalidated during the prefetch, go round again
+                    continue
+
+                timer = self._peek()
+                wake_at: datetime.datetime = self._horizon
+                if timer is not None and timer.expires < wake_at:
+                    wake_at = timer.expires
+
+                to_sleep = (wake_at - datetime.datetime.utcnow()).total_seconds()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=to_sleep)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            raise
+        except (OSError, discord.ConnectionClosed, asyncpg.PostgresConnectionError):
+            # popped timers that failed to delete are still in the table
+            self._horizon = None
+            await self._unlisten()
+            self._task = self.bot.loop.create_task(self.dispatch_timers())
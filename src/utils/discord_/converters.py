@@ -29,7 +29,6 @@ from discord.ext import commands
 from discord.ext.commands import FlagConverter
 from ossapi.ossapiv2 import Beatmap, Beatmapset, User
 from steam.steamid import steam64_from_url
-from wand.color import Color
 
 from ..helpers import (
     SpotifySearchData,
@@ -41,6 +40,7 @@ from ..helpers import (
     svgbytes_to_btyes,
     to_bytesio,
     to_thread,
+    wand_color,
     what,
 )
 from ..vars import (
@@ -59,6 +59,8 @@ from ..vars.errors import InvalidColor, NotTenorUrl, UnknownAccount
 if TYPE_CHECKING:
     from re import Match
 
+    from wand.color import Color
+
     from bot import Bot
     from cogs.context import Context
 
@@ -294,7 +296,7 @@ class OsuAccountConverter(commands.Converter):
 class ColorConverter(commands.Converter):
     async def convert(self, ctx: Context, argument: str) -> Color:
         try:
-            return Color(argument.strip())
+            return wand_color.Color(argument.strip())
         except ValueError as exc:
             raise InvalidColor(f"`{argument}` is not a valid color") from exc
 
@@ -311,7 +313,7 @@ class RobloxAccountConverter(commands.Converter):
             user = None
 
         return await fetch_user_id_by_name(
-            ctx.bot.session, argument if user is None else user
+            ctx.bot.web, argument if user is None else user
         )
 
 
@@ -721,7 +723,7 @@ class SpotifyConverter:
 
         api_data = {"q": query, "type": self.mode, "limit": "10", "market": "US"}
 
-        async with ctx.session.get(url, headers=headers, params=api_data) as resp:
+        async with ctx.bot.web.get(url, headers=headers, params=api_data) as resp:
             response_checker(resp)
             data: Optional[Dict[Any, Any]] = (
                 (await resp.json()).get(self.format_mode[self.mode]).get(f"items")
@@ -704,7 +704,7 @@ class CoverView(AuthorView):
         cover_id = self.data["albums"]["items"][0]["id"]
         bot = self.ctx.bot
         await bot.pool.execute(sql, cover_id)
-        await bot.redis.sadd("nsfw_covers", cover_id)
+        await bot.mirror.add("nsfw_covers", cover_id)
 
         if interaction.message is None:
             return
@@ -723,7 +723,7 @@ class CoverView(AuthorView):
         cover_id = self.data["albums"]["items"][0]["id"]
         bot = self.ctx.bot
         await bot.pool.execute(sql, cover_id)
-        await bot.redis.srem("nsfw_covers", cover_id)
+        await bot.mirror.remove("nsfw_covers", cover_id)
 
         if interaction.message is None:
             return
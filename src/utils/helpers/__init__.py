@@ -1,4 +1,7 @@
+from .lazy import *
+from .singleflight import *
 from .classes import *
 from .functions import *
 from .roblox import *
+from .thumbnails import *
 from .timer import *
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
 import datetime
+import re
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Literal, Optional, Sequence, TypeAlias, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeAlias,
+    Union,
+)
 
 import asyncpg
 import discord
@@ -20,7 +34,7 @@ if TYPE_CHECKING:
 
 
 class PGTimer:
-    __slots__ = ("args", "kwargs", "event", "id", "created_at", "expires")
+    __slots__ = ("args", "kwargs", "event", "id", "created_at", "expires", "owner_id")
 
     def __init__(self, *, record: asyncpg.Record):
         self.id: int = record["id"]
@@ -31,6 +45,7 @@ class PGTimer:
         self.event: str = record["event"]
         self.created_at: datetime.datetime = record["created"]
         self.expires: datetime.datetime = record["expires"]
+        self.owner_id: Optional[int] = record["owner_id"]
 
     @classmethod
     def temporary(
@@ -41,6 +56,7 @@ class PGTimer:
         event: str,
         args: Sequence[Any],
         kwargs: dict[str, Any],
+        owner_id: Optional[int] = None,
     ) -> Self:
         pseudo = {
             "id": None,
@@ -48,6 +64,7 @@ class PGTimer:
             "event": event,
             "created": created,
             "expires": expires,
+            "owner_id": owner_id,
         }
         return cls(record=pseudo)
 
@@ -205,3 +222,50 @@ class SpotifySearchData:
     track: str
     album: str
     artist: str
+
+
+class PokemonIndex:
+    """Pokémon names bucketed by length and by the letter at each position.
+
+    Solving a hint like ``p_k_c_u`` is then an intersection of one set per
+    position instead of matching every name against a regex. Blanks are
+    indexed as their own letter, covering every name with a-z there.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = [self.normalise(name) for name in names if name]
+        self._by_length: Dict[int, Set[int]] = {}
+        self._by_letter: Dict[Tuple[int, int, str], Set[int]] = {}
+
+        for index, name in enumerate(self.names):
+            self._by_length.setdefault(len(name), set()).add(index)
+            for position, letter in enumerate(name):
+                key = (len(name), position, letter)
+                self._by_letter.setdefault(key, set()).add(index)
+
+                # hint blanks only ever stand for a-z
+                if "a" <= letter <= "z":
+                    key = (len(name), position, "_")
+                    self._by_letter.setdefault(key, set()).add(index)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @staticmethod
+    def normalise(name: str) -> str:
+        name = re.sub("[\U00002640\U0000fe0f|\U00002642\U0000fe0f]", "", name.lower())
+        return re.sub("[\U000000e9]", "e", name)
+
+    def search(self, hint: str) -> List[str]:
+        """Returns every name matching the hint, ``_`` being any letter."""
+        hint = self.normalise(hint)
+        length = len(hint)
+
+        buckets = [self._by_length.get(length, set())]
+        for position, letter in enumerate(hint):
+            buckets.append(self._by_letter.get((length, position, letter), set()))
+
+        buckets.sort(key=len)
+        found = buckets[0].intersection(*buckets[1:])
+
+        return [self.names[index] for index in sorted(found)]
@@ -30,13 +30,9 @@ from typing import (
 import aiofiles
 import aiohttp
 import discord
-import yt_dlp
 from aiohttp import ClientResponse
 from dateutil.relativedelta import relativedelta
 from discord.ext import commands
-from PIL import Image as PImage
-from PIL import ImageSequence
-from wand.image import Image as wImage
 
 from ..vars import (
     TIKTOK_RE,
@@ -60,6 +56,8 @@ from ..vars import (
     SOUNDCLOUD_RE,
     RateLimitExceeded,
 )
+from .lazy import ImageSequence, PImage, wand_image, yt_dlp
+from .singleflight import flights
 
 if TYPE_CHECKING:
     from bot import Bot
@@ -181,24 +179,33 @@ async def download_video(
         ctx.bot.current_downloads.remove(f"{name}.{fmt}")
 
 
-async def get_prefix(bot: Bot, message: discord.Message) -> List[str]:
-    default = ["fish "] if not bot.testing else ["fish. "]
-
-    if message.guild is None:
-        return commands.when_mentioned_or(*default)(bot, message)
+def _prefix_matcher(bot: Bot, guild_id: int) -> Tuple[re.Pattern[str], List[str]]:
+    # guilds without custom prefixes all share the default matcher
+    key = guild_id if guild_id in bot.prefixes else None
 
     try:
-        prefixes = bot.prefixes[message.guild.id]
+        return bot.prefix_matchers[key]
     except KeyError:
-        prefixes = []
+        pass
+
+    default = ["fish "] if not bot.testing else ["fish. "]
+    packed = default + bot.prefixes.get(guild_id, [])
+    comp = re.compile("|".join(map(re.escape, packed)), flags=re.I)
+
+    bot.prefix_matchers[key] = (comp, packed)
+    return comp, packed
 
-    packed = default + prefixes
 
-    comp = re.compile("^(" + "|".join(map(re.escape, packed)) + ").*", flags=re.I)  # type: ignore
+async def get_prefix(bot: Bot, message: discord.Message) -> List[str]:
+    if message.guild is None:
+        default = ["fish "] if not bot.testing else ["fish. "]
+        return commands.when_mentioned_or(*default)(bot, message)
+
+    comp, packed = _prefix_matcher(bot, message.guild.id)
     match = comp.match(message.content)
 
     if match is not None:
-        return commands.when_mentioned_or(*[match.group(1)])(bot, message)
+        return commands.when_mentioned_or(match.group(0))(bot, message)
 
     return commands.when_mentioned_or(*packed)(bot, message)
 
@@ -228,24 +235,8 @@ def get_extensions(*, _path: str = "./src/cogs") -> List[str]:
     return exts
 
 
-def get_pokemon(bot: Bot, guess: str) -> List:
-    found = []
-    guess = re.sub("[\U00002640\U0000fe0f|\U00002642\U0000fe0f]", "", guess)
-    guess = re.sub("[\U000000e9]", "e", guess)
-
-    sorted_guesses = [p for p in bot.pokemon if len(p) == len(guess)]
-    for p in sorted_guesses:
-        new_pattern = re.compile(guess.replace(r"_", r"[a-z]{1}"))
-        results = new_pattern.match(p)
-
-        if results is None:
-            continue
-
-        answer = results.group()
-
-        found.append(answer)
-
-    return found
+def get_pokemon(bot: Bot, guess: str) -> List[str]:
+    return bot.pokemon.search(guess)
 
 
 async def no_dms(ctx: Context) -> bool:
@@ -260,15 +251,15 @@ async def owner_only(ctx: Context) -> bool:
 
 
 async def block_list(ctx: Context) -> bool:
-    blocked = await ctx.bot.redis.smembers("block_list")
+    mirror = ctx.bot.mirror
 
-    if str(ctx.author.id) in blocked:
+    if mirror.contains("block_list", ctx.author.id):
         return False
 
-    if str(ctx.guild.id) in blocked:
+    if mirror.contains("block_list", ctx.guild.id):
         return False
 
-    if str(ctx.guild.owner_id) in blocked:
+    if mirror.contains("block_list", ctx.guild.owner_id):
         return False
 
     return True
@@ -276,9 +267,7 @@ async def block_list(ctx: Context) -> bool:
 
 async def no_auto_commands(ctx: Context) -> bool:
     if ctx.command.name == "download":
-        return str(ctx.channel.id) not in await ctx.bot.redis.smembers(
-            "auto_download_channels"
-        )
+        return not ctx.bot.mirror.contains("auto_download_channels", ctx.channel.id)
 
     return True
 
@@ -381,9 +370,16 @@ async def get_lastfm_data(
     if extras:
         params.update(extras)
 
-    async with bot.session.get(url, params=params) as response:
-        response_checker(response)
-        return await response.json()
+    async def fetch() -> Dict[Any, Any]:
+        async with bot.web.get(url, params=params) as response:
+            response_checker(response)
+            return await response.json()
+
+    key = {k: v for k, v in params.items() if k != "api_key"}
+    return await flights.do(
+        ("lastfm", method, tuple(sorted((k, str(v)) for k, v in key.items()))),
+        lambda: bot.responses.fetch(f"lastfm.{method}", key, fetch),
+    )
 
 
 async def get_steam_data(
@@ -400,17 +396,48 @@ async def get_steam_data(
         f"steamid{'s' if ids else ''}": account,
     }
 
-    async with bot.session.get(url, params=params) as response:
-        response_checker(response)
-        return await response.json()
+    async def fetch() -> Dict:
+        async with bot.web.get(url, params=params) as response:
+            response_checker(response)
+            return await response.json()
+
+    key = {"version": version, "account": account, "ids": ids}
+    return await bot.responses.fetch(f"steam.{endpoint}", key, fetch)
 
 
 async def get_sp_cover(bot: Bot, query: str) -> Tuple[str, bool]:
-    results = bot.cached_covers.get(query)
+    cover = bot.cached_covers.get(query)
+
+    if cover is None:
+        cover = await flights.do(("spotify", query), lambda: _find_sp_cover(bot, query))
+
+    album_id, url = cover
+    # checked on every lookup so marking a cover nsfw applies straight away
+    return url, bot.mirror.contains("nsfw_covers", album_id)
+
+
+async def _find_sp_cover(bot: Bot, query: str) -> Tuple[str, str]:
+    sql = """SELECT album_id, url FROM spotify_covers
+             WHERE query = $1 AND fetched_at > NOW() - INTERVAL '30 days'
+          """
+    record = await bot.pool.fetchrow(sql, query)
+
+    if record is not None:
+        cover = (record["album_id"], record["url"])
+    else:
+        cover = await _search_sp_cover(bot, query)
+
+        sql = """INSERT INTO spotify_covers (query, album_id, url) VALUES ($1, $2, $3)
+                 ON CONFLICT (query) DO UPDATE
+                 SET album_id = EXCLUDED.album_id, url = EXCLUDED.url, fetched_at = NOW()
+              """
+        await bot.pool.execute(sql, query, *cover)
 
-    if results:
-        return results
+    bot.cached_covers[query] = cover
+    return cover
 
+
+async def _search_sp_cover(bot: Bot, query: str) -> Tuple[str, str]:
     if bot.spotify_key is None:
         raise ValueError("Spotify key is not set yet, maybe spotify cog needs loaded?")
 
@@ -423,21 +450,12 @@ async def get_sp_cover(bot: Bot, query: str) -> Tuple[str, bool]:
 
     data = {"q": query, "type": "album", "limit": "1"}
 
-    async with bot.session.get(url, headers=headers, params=data) as r:
+    async with bot.web.get(url, headers=headers, params=data) as r:
         results = await r.json()
 
     try:
-        cover = results["albums"]["items"][0]["images"][0]["url"]
-        nsfw = results["albums"]["items"][0]["id"] in await bot.redis.smembers(
-            "nsfw_covers"
-        )
-
-        try:
-            bot.cached_covers[query] = (cover, nsfw)
-        except KeyError:
-            pass
-
-        return cover, nsfw
+        album = results["albums"]["items"][0]
+        return album["id"], album["images"][0]["url"]
     except (IndexError, KeyError):
         raise NoCover("No cover found for this album, sorry.")
 
@@ -450,7 +468,7 @@ def svgbytes_to_btyes(
     height: int = 500,
     background="none",
 ) -> bytes:
-    with wImage(
+    with wand_image.Image(
         blob=svg,
         format="svg",
         width=width,
@@ -485,16 +503,11 @@ async def template(session: aiohttp.ClientSession, assetID: int) -> BytesIO:
 async def to_bytesio(
     session: aiohttp.ClientSession, url: str, skip_check: bool = False
 ) -> BytesIO:
-    async with session.get(url) as resp:
-        if not skip_check:
-            response_checker(resp)
+    # each caller gets its own buffer over the shared bytes
+    return BytesIO(await to_bytes(session, url, skip_check))
 
-        data = await resp.read()
 
-        return BytesIO(data)
-
-
-async def to_bytes(
+async def _read_url(
     session: aiohttp.ClientSession, url: str, skip_check: bool = False
 ) -> bytes:
     async with session.get(url) as resp:
@@ -506,6 +519,14 @@ async def to_bytes(
     return data
 
 
+async def to_bytes(
+    session: aiohttp.ClientSession, url: str, skip_check: bool = False
+) -> bytes:
+    return await flights.do(
+        ("url", url, skip_check), lambda: _read_url(session, url, skip_check)
+    )
+
+
 async def mobile(self) -> None:
     """Sends the IDENTIFY packet."""
     payload = {
@@ -551,6 +572,19 @@ def add_prefix(bot: Bot, guild_id: int, prefix: str):
     except KeyError:
         bot.prefixes[guild_id] = [prefix]
 
+    bot.prefix_matchers.pop(guild_id, None)
+
+
+def remove_prefix(bot: Bot, guild_id: int, prefix: str):
+    """Raises KeyError or ValueError if the prefix isn't set."""
+    prefixes = bot.prefixes[guild_id]
+    prefixes.remove(prefix)
+
+    if not prefixes:
+        del bot.prefixes[guild_id]
+
+    bot.prefix_matchers.pop(guild_id, None)
+
 
 async def get_lastfm(bot: Bot, user_id: int) -> str:
     """Get the last.fm username for the given user ID."""
@@ -727,12 +761,17 @@ def human_timedelta(
             return " ".join(output) + output_suffix
 
 
+def grid_size(count: int) -> int:
+    """The width of each image in a :func:`format_bytes` grid of ``count`` images."""
+    return int(2520 / math.ceil(math.sqrt(count)))
+
+
 # https://github.com/CuteFwan/Koishi/blob/master/cogs/avatar.py#L82-L102
 @to_thread
 def format_bytes(filesize_limit: int, images: List[bytes]) -> BytesIO:
     xbound = math.ceil(math.sqrt(len(images)))
     ybound = math.ceil(len(images) / xbound)
-    size = int(2520 / xbound)
+    size = grid_size(len(images))
 
     with PImage.new(
         "RGBA", size=(xbound * size, ybound * size), color=(0, 0, 0, 0)
@@ -740,9 +779,10 @@ def format_bytes(filesize_limit: int, images: List[bytes]) -> BytesIO:
         x, y = 0, 0
         for avy in images:
             if avy:
-                im = PImage.open(BytesIO(avy)).resize(
-                    (size, size), resample=PImage.BICUBIC
-                )
+                im = PImage.open(BytesIO(avy))
+                # cached thumbnails can be smaller than the grid, scale them up
+                if im.size != (size, size):
+                    im = im.resize((size, size), resample=PImage.BICUBIC)
                 base.paste(im, box=(x * size, y * size))
             if x < xbound - 1:
                 x += 1
@@ -953,7 +993,7 @@ async def get_recent_track(bot: Bot, name: str):
 @to_thread
 def get_wh(image: BytesIO) -> Tuple[int, int]:
     new_image = BytesIO(image.getvalue())
-    with wImage(file=new_image) as output:
+    with wand_image.Image(file=new_image) as output:
         return output.size
 
 
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import time
+from types import ModuleType
+from typing import Any, List, Optional
+
+
+class LazyModule:
+    """Stands in for a module until one of its attributes is first used.
+
+    For the heavy libraries only a handful of commands need, so importing
+    them doesn't slow down every start. :func:`warm_up_modules` loads them
+    in the background once the bot is ready.
+    """
+
+    modules: List[LazyModule] = []
+
+    def __init__(self, name: str):
+        self._name: str = name
+        self._module: Optional[ModuleType] = None
+        # seconds it took to import, None until loaded
+        self.import_time: Optional[float] = None
+        LazyModule.modules.append(self)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule name={self._name} loaded={self.loaded}>"
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        if self._module is None:
+            start = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            self.import_time = time.perf_counter() - start
+
+        return self._module
+
+
+async def warm_up_modules() -> None:
+    for module in LazyModule.modules:
+        if not module.loaded:
+            await asyncio.to_thread(module.load)
+
+
+yt_dlp = LazyModule("yt_dlp")
+playwright = LazyModule("playwright.async_api")
+wand_image = LazyModule("wand.image")
+wand_color = LazyModule("wand.color")
+PImage = LazyModule("PIL.Image")
+ImageDraw = LazyModule("PIL.ImageDraw")
+ImageFont = LazyModule("PIL.ImageFont")
+ImageSequence = LazyModule("PIL.ImageSequence")
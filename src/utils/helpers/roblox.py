@@ -1,11 +1,14 @@
-from typing import Dict, List
+from __future__ import annotations
 
-from aiohttp import ClientSession
+from typing import TYPE_CHECKING, Dict, List
 
 from .functions import response_checker
 
+if TYPE_CHECKING:
+    from ..core import WebClient
 
-async def fetch_usernames(session: ClientSession, account_id: int) -> List[str]:
+
+async def fetch_usernames(session: WebClient, account_id: int) -> List[str]:
     """Get a list of badges for a user"""
 
     cursor = ""
@@ -26,7 +29,7 @@ async def fetch_usernames(session: ClientSession, account_id: int) -> List[str]:
     return usernames
 
 
-async def fetch_badges(session: ClientSession, account_id: int) -> Dict:
+async def fetch_badges(session: WebClient, account_id: int) -> Dict:
     """Get a list of badges for a user"""
 
     async with session.get(
@@ -36,7 +39,7 @@ async def fetch_badges(session: ClientSession, account_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_onlinestatus(session: ClientSession, account_id: int) -> Dict:
+async def fetch_onlinestatus(session: WebClient, account_id: int) -> Dict:
     """Gets the online status of a user"""
 
     async with session.get(
@@ -47,7 +50,7 @@ async def fetch_onlinestatus(session: ClientSession, account_id: int) -> Dict:
 
 
 async def fetch_headshot(
-    session: ClientSession,
+    session: WebClient,
     account_id: int,
     width: int = 420,
     height: int = 420,
@@ -66,7 +69,7 @@ async def fetch_headshot(
 
 
 async def fetch_outfit_image(
-    session: ClientSession,
+    session: WebClient,
     account_id: int,
     width: int = 420,
     height: int = 420,
@@ -85,7 +88,7 @@ async def fetch_outfit_image(
 
 
 async def fetch_asset_thumbnail(
-    session: ClientSession,
+    session: WebClient,
     asset_id: int,
     width: int = 420,
     height: int = 420,
@@ -103,7 +106,7 @@ async def fetch_asset_thumbnail(
         return str(resp.url)
 
 
-async def fetch_user_id_by_name(session: ClientSession, name: str) -> int:
+async def fetch_user_id_by_name(session: WebClient, name: str) -> int:
     """
     Returns the user id of a user by their name
     """
@@ -114,7 +117,7 @@ async def fetch_user_id_by_name(session: ClientSession, name: str) -> int:
         return (await resp.json())["Id"]
 
 
-async def fetch_outfits(session: ClientSession, account_id: int) -> Dict:
+async def fetch_outfits(session: WebClient, account_id: int) -> Dict:
     """
     Returns the outfits of a user
     """
@@ -125,7 +128,7 @@ async def fetch_outfits(session: ClientSession, account_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_avatar(session: ClientSession, account_id: int) -> Dict:
+async def fetch_avatar(session: WebClient, account_id: int) -> Dict:
     """
     Returns the avatar of a user
     """
@@ -136,7 +139,7 @@ async def fetch_avatar(session: ClientSession, account_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_primary_group(session: ClientSession, account_id: int) -> Dict:
+async def fetch_primary_group(session: WebClient, account_id: int) -> Dict:
     """
     Returns the primary group of a user
     """
@@ -147,7 +150,7 @@ async def fetch_primary_group(session: ClientSession, account_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_rblx_trade_user_info(session: ClientSession, account_id: int) -> Dict:
+async def fetch_rblx_trade_user_info(session: WebClient, account_id: int) -> Dict:
     """
     Returns the rblx trade user info of a user
     """
@@ -158,7 +161,7 @@ async def fetch_rblx_trade_user_info(session: ClientSession, account_id: int) ->
         return await resp.json()
 
 
-async def fetch_info(session: ClientSession, account_id: int) -> Dict:
+async def fetch_info(session: WebClient, account_id: int) -> Dict:
     """
     Returns the info of a user
     """
@@ -167,7 +170,7 @@ async def fetch_info(session: ClientSession, account_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_friends(session: ClientSession, account_id: int) -> Dict:
+async def fetch_friends(session: WebClient, account_id: int) -> Dict:
     """
     Returns the friend count of a user
     """
@@ -178,7 +181,7 @@ async def fetch_friends(session: ClientSession, account_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_followers(session: ClientSession, account_id: int) -> Dict:
+async def fetch_followers(session: WebClient, account_id: int) -> Dict:
     """
     Returns the followers of a user
     """
@@ -189,7 +192,7 @@ async def fetch_followers(session: ClientSession, account_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_friend_count(session: ClientSession, account_id: int) -> int:
+async def fetch_friend_count(session: WebClient, account_id: int) -> int:
     """
     Returns the friend count of a user
     """
@@ -200,7 +203,7 @@ async def fetch_friend_count(session: ClientSession, account_id: int) -> int:
         return (await resp.json())["count"]
 
 
-async def fetch_followers_count(session: ClientSession, account_id: int) -> int:
+async def fetch_followers_count(session: WebClient, account_id: int) -> int:
     """
     Returns the followers of a user
     """
@@ -211,7 +214,7 @@ async def fetch_followers_count(session: ClientSession, account_id: int) -> int:
         return (await resp.json())["count"]
 
 
-async def fetch_groups(session: ClientSession, group_ids: List[int]) -> Dict:
+async def fetch_groups(session: WebClient, group_ids: List[int]) -> Dict:
     """
     Multi-get groups information by Ids
     """
@@ -224,7 +227,7 @@ async def fetch_groups(session: ClientSession, group_ids: List[int]) -> Dict:
         return await resp.json()
 
 
-async def fetch_group(session: ClientSession, group_id: int) -> Dict:
+async def fetch_group(session: WebClient, group_id: int) -> Dict:
     """
     Multi-get groups information by Ids
     """
@@ -233,7 +236,7 @@ async def fetch_group(session: ClientSession, group_id: int) -> Dict:
         return await resp.json()
 
 
-async def fetch_user_groups(session: ClientSession, account_id: int) -> Dict:
+async def fetch_user_groups(session: WebClient, account_id: int) -> Dict:
     """
     Returns the groups of a user
     """
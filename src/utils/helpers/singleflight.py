@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Lets concurrent calls for the same thing share a single request.
+
+    The first caller for a key starts the work, everyone that asks for the
+    same key before it finishes waits on that instead of starting their
+    own. Nothing is kept afterwards, the next call after it finishes goes
+    to the upstream again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future[Any]] = {}
+        self.stats: Counter[str] = Counter()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+
+        if future is None:
+            self.stats["calls"] += 1
+            future = self._calls[key] = asyncio.ensure_future(func())
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.stats["shared"] += 1
+
+        # one caller giving up shouldn't cancel it for the others
+        return await asyncio.shield(future)
+
+
+flights = SingleFlight()
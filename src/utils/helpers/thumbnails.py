@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import pathlib
+import threading
+from collections import Counter
+from io import BytesIO
+from typing import Optional, Tuple
+
+import aiohttp
+
+from .functions import to_bytes
+from .lazy import PImage
+from .singleflight import flights
+
+THUMBNAIL_CACHE = pathlib.Path("src/files/cache/thumbnails")
+
+
+class ThumbnailCache:
+    """Resized copies of remote images, kept on disk.
+
+    Grids and charts download the same covers, avatars and icons over and
+    over just to shrink them. :meth:`get` stores the result per url and
+    size, so the next time neither the download nor the resize happens.
+
+    Thumbnails are never stored bigger than :attr:`max_dimension` or the
+    source image, whichever is smaller, so a grid of a few images doesn't
+    fill the cache with huge upscaled copies. Callers scale them up to
+    whatever size they draw them at.
+
+    Files are named after a hash of the url and size. Reading one bumps its
+    mtime; when the directory goes over :attr:`max_size` bytes the least
+    recently used files are deleted until it's under :attr:`keep_size`.
+    """
+
+    max_size: int = 256 * 1024 * 1024
+    keep_size: int = 192 * 1024 * 1024
+    max_dimension: int = 512
+
+    def __init__(self, path: pathlib.Path):
+        self.path: pathlib.Path = path
+        # bytes on disk, worked out on first write
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+        self.stats: Counter[str] = Counter()
+
+    def _file(self, url: str, size: Tuple[int, int]) -> pathlib.Path:
+        digest = hashlib.sha256(f"{url}|{size[0]}x{size[1]}".encode()).hexdigest()
+        return self.path / digest[:2] / f"{digest}.png"
+
+    def _read(self, file: pathlib.Path) -> Optional[bytes]:
+        try:
+            data = file.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+
+        return data
+
+    def _files(self):
+        for file in self.path.glob("*/*.png"):
+            try:
+                yield file, file.stat()
+            except FileNotFoundError:
+                continue
+
+    def _write(self, file: pathlib.Path, data: bytes) -> None:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        temp = file.with_suffix(".tmp")
+        temp.write_bytes(data)
+
+        with self._lock:
+            # another process or an expired flight may have written it already
+            try:
+                replaced = file.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+
+            os.replace(temp, file)
+
+            if self._size is None:
+                self._size = sum(stat.st_size for _, stat in self._files())
+            else:
+                self._size += len(data) - replaced
+
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = sorted(self._files(), key=lambda f: f[1].st_mtime)
+        size = sum(stat.st_size for _, stat in files)
+
+        for file, stat in files:
+            if size <= self.keep_size:
+                break
+
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                pass
+
+            size -= stat.st_size
+            self.stats["evicted"] += 1
+
+        self._size = size
+
+    @staticmethod
+    def _resize(data: bytes, size: Tuple[int, int]) -> bytes:
+        with PImage.open(BytesIO(data)) as image:
+            # no point storing more pixels than the source has
+            size = (min(size[0], image.width), min(size[1], image.height))
+            thumbnail = image.convert("RGBA").resize(size, resample=PImage.BICUBIC)
+
+        buffer = BytesIO()
+        thumbnail.save(buffer, "png")
+        return buffer.getvalue()
+
+    async def _fetch(
+        self, session: aiohttp.ClientSession, url: str, size: Tuple[int, int]
+    ) -> bytes:
+        file = self._file(url, size)
+
+        data = await asyncio.to_thread(self._read, file)
+        if data is not None:
+            self.stats["hits"] += 1
+            return data
+
+        self.stats["misses"] += 1
+        data = await asyncio.to_thread(self._resize, await to_bytes(session, url), size)
+
+        try:
+            await asyncio.to_thread(self._write, file, data)
+        except OSError:
+            # still usable, it just won't be cached
+            self.stats["failed"] += 1
+
+        return data
+
+    async def get(
+        self, session: aiohttp.ClientSession, url: str, size: Tuple[int, int]
+    ) -> bytes:
+        """The image at ``url`` resized to ``size``, as png bytes.
+
+        ``size`` is capped, see :attr:`max_dimension`, so the result can be
+        smaller than asked for.
+        """
+        size = (min(size[0], self.max_dimension), min(size[1], self.max_dimension))
+        return await flights.do(
+            ("thumbnail", url, size), lambda: self._fetch(session, url, size)
+        )
+
+
+thumbnails = ThumbnailCache(THUMBNAIL_CACHE)
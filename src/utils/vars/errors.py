@@ -50,6 +50,10 @@ class NotTenorUrl(BlankException):
     pass
 
 
+class MigrationError(Exception):
+    pass
+
+
 class ResponseError(Exception):
     def __init__(self, message: str) -> None:
         self.message = message
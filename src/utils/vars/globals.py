@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import aiohttp
 import discord
@@ -40,6 +40,12 @@ module_extensions = [
     "cogs.lastfm",
 ]
 
+# extensions every other extension waits for, the rest are loaded concurrently
+base_extensions = ["cogs.context"]
+
+# extension -> extensions that have to finish loading before it
+extension_dependencies: Dict[str, List[str]] = {}
+
 default_headers = {"User-Agent": f"aiohttp/{aiohttp.__version__}; fish_bot"}
 
 emoji_extras = {"BPerms": ["Manage Emojis"], "UPerms": ["Manage Emojis"]}
@@ -172,6 +178,7 @@ status_state = {
 }
 
 TATSU_ID: int = 172002275412279296
+POKETWO_ID: int = 716390085896962058
 OWNER_ID: int = 766953372309127168
 TABLE_BOOSTER_ID: int = 848529361362747422
 TABLE_ID: int = 848507662437449750